@@ -652,38 +652,31 @@ def _js_node_options() -> str:
 
 
 def _js_install_env() -> dict:
-    env = dict(os.environ)
-    env["NODE_ENV"] = "development"
-    env["NPM_CONFIG_PRODUCTION"] = "false"
-    # Ensure optional native binaries (e.g., SWC/esbuild) are installed.
-    env["NPM_CONFIG_OPTIONAL"] = "true"
-    env["NPM_CONFIG_OMIT"] = ""
-    env["npm_config_optional"] = "true"
-    env["npm_config_omit"] = ""
-    env["NODE_OPTIONS"] = _js_node_options()
-    return env
+    return {
+        "NODE_ENV": "development",
+        "NPM_CONFIG_PRODUCTION": "false",
+        # Ensure optional native binaries (e.g., SWC/esbuild) are installed.
+        "NPM_CONFIG_OPTIONAL": "true",
+        "NPM_CONFIG_OMIT": "",
+        "npm_config_optional": "true",
+        "npm_config_omit": "",
+        "NODE_OPTIONS": _js_node_options(),
+    }
 
 
 def _js_build_env() -> dict:
     """Env for npm run build — caps V8 heap, lets Wasm map freely."""
-    env = dict(os.environ)
-    env["NODE_OPTIONS"] = _js_node_options()
-    return env
+    return {"NODE_OPTIONS": _js_node_options()}
 
 
 def _js_test_env() -> dict:
-    env = dict(os.environ)
-    env["CI"] = "true"
-    env["NODE_OPTIONS"] = _js_node_options()
-    return env
+    return {"CI": "true", "NODE_OPTIONS": _js_node_options()}
 
 
 def _js_oom_retry_shared_env() -> dict:
     # RLIMIT_AS is already disabled for JS by default (see limits.py).
     # This env is still used to carry any future shared retry state.
-    env = dict(os.environ)
-    env["NODE_OPTIONS"] = _js_node_options()
-    return env
+    return {"NODE_OPTIONS": _js_node_options()}
 
 
 def _python_install_with_dev_dependencies(command: str, package_manager: str, repo_dir: Path) -> str:
@@ -725,16 +718,15 @@ def _python_install_with_dev_dependencies(command: str, package_manager: str, re
 
 
 def _bundler_install_env(max_jobs: int = 2) -> dict:
-    env = dict(os.environ)
-    env["BUNDLE_DEPLOYMENT"] = "false"
-    env["BUNDLE_FROZEN"] = "false"
-    env["BUNDLE_WITHOUT"] = ""
-    env["BUNDLE_JOBS"] = str(max_jobs)
-    return env
+    return {
+        "BUNDLE_DEPLOYMENT": "false",
+        "BUNDLE_FROZEN": "false",
+        "BUNDLE_WITHOUT": "",
+        "BUNDLE_JOBS": str(max_jobs),
+    }
 
 
 def _jvm_shared_env(heap_mb: int, max_workers: int) -> dict:
-    env = dict(os.environ)
     java_flags = (
         f"-Xms256m -Xmx{heap_mb}m -XX:MaxMetaspaceSize=768m "
         "-XX:+UseSerialGC -XX:+HeapDumpOnOutOfMemoryError"
@@ -743,24 +735,19 @@ def _jvm_shared_env(heap_mb: int, max_workers: int) -> dict:
         f"-Dorg.gradle.daemon=false -Dorg.gradle.parallel=false "
         f"-Dorg.gradle.workers.max={max_workers}"
     )
-    env["JAVA_TOOL_OPTIONS"] = _append_env_tokens(env.get("JAVA_TOOL_OPTIONS"), java_flags)
-    env["MAVEN_OPTS"] = _append_env_tokens(env.get("MAVEN_OPTS"), java_flags)
-    env["GRADLE_OPTS"] = _append_env_tokens(env.get("GRADLE_OPTS"), gradle_flags)
-    return env
+    return {
+        "JAVA_TOOL_OPTIONS": _append_env_tokens(os.environ.get("JAVA_TOOL_OPTIONS"), java_flags),
+        "MAVEN_OPTS": _append_env_tokens(os.environ.get("MAVEN_OPTS"), java_flags),
+        "GRADLE_OPTS": _append_env_tokens(os.environ.get("GRADLE_OPTS"), gradle_flags),
+    }
 
 
 def _rust_shared_env(max_jobs: int) -> dict:
-    env = dict(os.environ)
-    env["CARGO_BUILD_JOBS"] = str(max_jobs)
-    env["CARGO_INCREMENTAL"] = "0"
-    return env
+    return {"CARGO_BUILD_JOBS": str(max_jobs), "CARGO_INCREMENTAL": "0"}
 
 
 def _cpp_shared_env(max_jobs: int) -> dict:
-    env = dict(os.environ)
-    env["CMAKE_BUILD_PARALLEL_LEVEL"] = str(max_jobs)
-    env["MAKEFLAGS"] = f"-j{max_jobs}"
-    return env
+    return {"CMAKE_BUILD_PARALLEL_LEVEL": str(max_jobs), "MAKEFLAGS": f"-j{max_jobs}"}
 
 
 def _is_native_linker_failure(stderr: str, stdout: str = "") -> bool:
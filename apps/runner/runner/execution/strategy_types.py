@@ -75,6 +75,8 @@ class ExecutionAttemptPlan:
     typecheck_command: Optional[str]
     test_command: Optional[str]
     bench_command: Optional[str]
+    # Env fields hold overrides only; run_step() layers them over os.environ
+    # when it launches the step, so os.environ is copied once per step.
     shared_env: Optional[dict] = None
     install_env: Optional[dict] = None
     build_env: Optional[dict] = None
@@ -11,10 +11,12 @@ stdout/stderr capture for artifact storage.
 import logging
 import os
 import json
+import re
 import subprocess
 import time
 from pathlib import Path
-from typing import Optional
+from types import MappingProxyType
+from typing import Mapping, Optional
 
 from runner.detector.types import DetectionResult
 from runner.execution.strategy_engine import run_with_strategy
@@ -41,31 +43,38 @@ _RESOURCE_PROFILE_NATIVE = "native"
 _RESOURCE_PROFILE_PYTHON = "python"
 
 
-def _install_step_env(package_manager: Optional[str]) -> Optional[dict]:
+# npm/yarn honor NPM_CONFIG_PRODUCTION and install devDependencies even when
+# process env defaults to production.
+_JS_INSTALL_ENV: Mapping[str, str] = MappingProxyType({
+    "NODE_ENV": "development",
+    "NPM_CONFIG_PRODUCTION": "false",
+})
+# Bundler deploy mode (or BUNDLE_WITHOUT) can exclude test/development groups,
+# making baseline test runs fail despite healthy repos.
+_RUBY_INSTALL_ENV: Mapping[str, str] = MappingProxyType({
+    "BUNDLE_DEPLOYMENT": "false",
+    "BUNDLE_FROZEN": "false",
+    "BUNDLE_WITHOUT": "",
+})
+_INSTALL_ENV_BY_PM: dict[str, Mapping[str, str]] = {
+    **{pm: _JS_INSTALL_ENV for pm in JS_PACKAGE_MANAGERS},
+    **{pm: _RUBY_INSTALL_ENV for pm in RUBY_PACKAGE_MANAGERS},
+}
+
+
+def _install_step_env(package_manager: Optional[str]) -> Optional[Mapping[str, str]]:
     """Return env overrides for install step.
 
     Railway/production environments commonly set language-specific dependency
     filtering env vars. We normalize install-time env so baseline validation
     has the dependencies needed to run build/test commands.
+
+    Only the overrides are returned, as a shared read-only mapping; run_step()
+    layers them over the inherited environment when it launches the step.
     """
-    pm = (package_manager or "").lower()
-    if pm not in JS_PACKAGE_MANAGERS and pm not in RUBY_PACKAGE_MANAGERS:
+    if not package_manager:
         return None
-
-    env = dict(os.environ)
-    if pm in JS_PACKAGE_MANAGERS:
-        env["NODE_ENV"] = "development"
-        # npm/yarn honor this flag and install devDependencies even when process
-        # env defaults to production.
-        env["NPM_CONFIG_PRODUCTION"] = "false"
-
-    if pm in RUBY_PACKAGE_MANAGERS:
-        # Bundler deploy mode (or BUNDLE_WITHOUT) can exclude test/development
-        # groups, making baseline test runs fail despite healthy repos.
-        env["BUNDLE_DEPLOYMENT"] = "false"
-        env["BUNDLE_FROZEN"] = "false"
-        env["BUNDLE_WITHOUT"] = ""
-    return env
+    return _INSTALL_ENV_BY_PM.get(package_manager.lower())
 
 
 def _prepare_test_step(
@@ -82,8 +91,7 @@ def _prepare_test_step(
     if pm not in JS_PACKAGE_MANAGERS:
         return test_command, None
 
-    env = dict(os.environ)
-    env["CI"] = "true"
+    env = {"CI": "true"}
 
     command = test_command
     if _is_vitest_command(repo_dir, test_command):
@@ -159,7 +167,7 @@ def _append_test_args(test_command: str, args: list[str]) -> str:
     return f"{command} {arg_string}"
 
 
-def _prepare_subprocess_env(command: str, env: Optional[dict]) -> dict:
+def _prepare_subprocess_env(command: str, env: Optional[Mapping[str, str]]) -> dict:
     """Merge caller env with inherited env and inject resource profile."""
     merged_env = dict(os.environ)
     if env:
@@ -168,79 +176,84 @@ def _prepare_subprocess_env(command: str, env: Optional[dict]) -> dict:
     return merged_env
 
 
+_JS_PROFILE_HINTS = (
+    "npm ",
+    "pnpm ",
+    "yarn ",
+    "bun ",
+    "node ",
+    "npx ",
+    "next ",
+    "vitest",
+    "jest",
+    "tsc ",
+    "vite ",
+    "webpack ",
+)
+_JVM_PROFILE_HINTS = (
+    "mvn ",
+    "mvnw",
+    "gradle ",
+    "gradlew",
+    "java ",
+    "javac ",
+    "kotlinc ",
+)
+_NATIVE_PROFILE_HINTS = (
+    "cargo ",
+    "rustc ",
+    "cmake ",
+    "ctest ",
+    "make ",
+    "ninja ",
+    "clang++",
+    "g++",
+    "ld ",
+    "lld ",
+    "mold ",
+    "-fuse-ld=",
+)
+# uv, pip, poetry, etc. are Rust/C binaries that mmap large blocks during
+# parallel package downloads — 4 GB RLIMIT_AS is easily exhausted even when
+# physical RAM is plentiful. Disable RLIMIT_AS and rely on the wall-clock
+# timeout + cgroup limits instead (same treatment as JS/Wasm).
+_PYTHON_PROFILE_HINTS = (
+    "uv ",
+    "uv\t",
+    "pip ",
+    "pip3 ",
+    "poetry ",
+    "pipenv ",
+    "conda ",
+    "mamba ",
+    "micromamba ",
+    "hatch ",
+    "pdm ",
+    "rye ",
+    "pytest",
+    "python ",
+    "python3 ",
+)
+
+# One compiled alternation per profile, checked in priority order, so each
+# profile costs a single scan of the command instead of one per hint.
+_RESOURCE_PROFILE_MATCHERS: tuple[tuple[str, re.Pattern[str]], ...] = tuple(
+    (profile, re.compile("|".join(map(re.escape, hints))))
+    for profile, hints in (
+        (_RESOURCE_PROFILE_JS, _JS_PROFILE_HINTS),
+        (_RESOURCE_PROFILE_JVM, _JVM_PROFILE_HINTS),
+        (_RESOURCE_PROFILE_NATIVE, _NATIVE_PROFILE_HINTS),
+        (_RESOURCE_PROFILE_PYTHON, _PYTHON_PROFILE_HINTS),
+    )
+)
+
+
 def _infer_resource_profile(command: str) -> str:
     """Infer resource-limit profile from command text."""
     normalized = " ".join(command.strip().lower().split())
-    js_hints = (
-        "npm ",
-        "pnpm ",
-        "yarn ",
-        "bun ",
-        "node ",
-        "npx ",
-        "next ",
-        "vitest",
-        "jest",
-        "tsc ",
-        "vite ",
-        "webpack ",
-    )
-    if any(hint in normalized for hint in js_hints):
-        return _RESOURCE_PROFILE_JS
-
-    jvm_hints = (
-        "mvn ",
-        "mvnw",
-        "gradle ",
-        "gradlew",
-        "java ",
-        "javac ",
-        "kotlinc ",
-    )
-    if any(hint in normalized for hint in jvm_hints):
-        return _RESOURCE_PROFILE_JVM
-
-    native_hints = (
-        "cargo ",
-        "rustc ",
-        "cmake ",
-        "ctest ",
-        "make ",
-        "ninja ",
-        "clang++",
-        "g++",
-        "ld ",
-        "lld ",
-        "mold ",
-        "-fuse-ld=",
-    )
-    if any(hint in normalized for hint in native_hints):
-        return _RESOURCE_PROFILE_NATIVE
-
-    # uv, pip, poetry, etc. are Rust/C binaries that mmap large blocks during
-    # parallel package downloads — 4 GB RLIMIT_AS is easily exhausted even when
-    # physical RAM is plentiful. Disable RLIMIT_AS and rely on the wall-clock
-    # timeout + cgroup limits instead (same treatment as JS/Wasm).
-    python_hints = (
-        "uv ",
-        "uv\t",
-        "pip ",
-        "pip3 ",
-        "poetry ",
-        "pipenv ",
-        "conda ",
-        "mamba ",
-        "micromamba ",
-        "hatch ",
-        "pdm ",
-        "rye ",
-        "pytest",
-        "python ",
-        "python3 ",
-    )
-    if any(hint in normalized for hint in python_hints):
-        return _RESOURCE_PROFILE_PYTHON
-
+    for profile, matcher in _RESOURCE_PROFILE_MATCHERS:
+        if matcher.search(normalized):
+            return profile
     return _RESOURCE_PROFILE_DEFAULT
 
 
@@ -278,7 +291,7 @@ def run_step(
     command: str,
     cwd: Path,
     timeout: int = DEFAULT_TIMEOUT,
-    env: Optional[dict] = None,
+    env: Optional[Mapping[str, str]] = None,
 ) -> StepResult:
     """Execute a single pipeline step as a subprocess.
 
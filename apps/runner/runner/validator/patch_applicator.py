@@ -8,7 +8,9 @@ The diff string must be a unified diff as produced by difflib.unified_diff
 (header lines like '--- a/file.ts' and '+++ b/file.ts', with -p1 strip level).
 """
 
+import functools
 import logging
+import shutil
 import subprocess
 from pathlib import Path
 from typing import Optional
@@ -34,7 +36,7 @@ def apply_diff(repo_dir: Path, diff: str) -> None:
     Uses `patch -p1` to strip the leading 'a/' or 'b/' path prefix.
     Raises PatchApplyError if the patch cannot be cleanly applied.
     """
-    if not diff.strip():
+    if not diff or diff.isspace():
         raise PatchApplyError("Empty diff — nothing to apply")
 
     result = _run_patch(repo_dir, diff, reverse=False)
@@ -55,7 +57,7 @@ def revert_diff(repo_dir: Path, diff: str) -> None:
     Uses `patch -p1 -R` to apply the inverse transformation.
     Raises PatchApplyError if the revert fails.
     """
-    if not diff.strip():
+    if not diff or diff.isspace():
         raise PatchApplyError("Empty diff — nothing to revert")
 
     result = _run_patch(repo_dir, diff, reverse=True)
@@ -105,14 +107,11 @@ def _run_patch(
         raise PatchApplyError(f"Unexpected error running patch: {exc}")
 
 
+@functools.cache
 def check_patch_available() -> bool:
-    """Return True if the system `patch` binary is accessible."""
-    try:
-        result = subprocess.run(
-            ["patch", "--version"],
-            capture_output=True,
-            text=True,
-        )
-        return result.returncode == 0
-    except FileNotFoundError:
-        return False
+    """Return True if the system `patch` binary is accessible.
+
+    Resolved with a PATH lookup rather than running `patch --version`, and
+    cached for the life of the process since the binary does not come and go.
+    """
+    return shutil.which("patch") is not None
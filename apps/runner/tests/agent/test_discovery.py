@@ -352,44 +352,46 @@ class TestIsNew:
             approaches=["fix it"],
         )
 
-    def test_new_type_and_file_returns_true(self):
-        seen = frozenset({("tech_debt", "src/a.ts")})
-        opp = self._make_opp("performance", "src/b.ts:5")
-        assert _is_new(opp, seen) is True
-
-    def test_same_type_and_file_returns_false(self):
-        seen = frozenset({("performance", "src/a.ts")})
-        opp = self._make_opp("performance", "src/a.ts:10-20")
-        assert _is_new(opp, seen) is False
-
-    def test_same_file_different_type_returns_true(self):
-        seen = frozenset({("tech_debt", "src/a.ts")})
-        opp = self._make_opp("performance", "src/a.ts:1")
-        assert _is_new(opp, seen) is True
-
-    def test_same_type_different_file_returns_true(self):
-        seen = frozenset({("performance", "src/a.ts")})
-        opp = self._make_opp("performance", "src/b.ts:1")
-        assert _is_new(opp, seen) is True
-
-    def test_empty_seen_always_returns_true(self):
-        opp = self._make_opp("performance", "src/a.ts:5")
-        assert _is_new(opp, frozenset()) is True
-
-    def test_empty_location_uses_empty_file_path(self):
-        seen = frozenset({("performance", "")})
-        opp = self._make_opp("performance", "")
-        assert _is_new(opp, seen) is False
-
-    def test_location_without_line_number_matches_entry(self):
-        seen = frozenset({("performance", "src/a.ts")})
-        opp = self._make_opp("performance", "src/a.ts")
-        assert _is_new(opp, seen) is False
-
-    def test_strips_whitespace_from_file_path(self):
-        seen = frozenset({("performance", "src/a.ts")})
-        opp = self._make_opp("performance", " src/a.ts :10")
-        assert _is_new(opp, seen) is False
+    @pytest.mark.parametrize("seen, type_, location, expected", [
+        pytest.param(
+            {("tech_debt", "src/a.ts")}, "performance", "src/b.ts:5", True,
+            id="new-type-and-file",
+        ),
+        pytest.param(
+            {("performance", "src/a.ts")}, "performance", "src/a.ts:10-20", False,
+            id="same-type-and-file",
+        ),
+        pytest.param(
+            {("tech_debt", "src/a.ts")}, "performance", "src/a.ts:1", True,
+            id="same-file-different-type",
+        ),
+        pytest.param(
+            {("performance", "src/a.ts")}, "performance", "src/b.ts:1", True,
+            id="same-type-different-file",
+        ),
+        pytest.param(set(), "performance", "src/a.ts:5", True, id="empty-seen"),
+        pytest.param(
+            {("performance", "")}, "performance", "", False,
+            id="empty-location-uses-empty-file-path",
+        ),
+        pytest.param(
+            {("performance", "src/a.ts")}, "performance", "src/a.ts", False,
+            id="location-without-line-number",
+        ),
+        pytest.param(
+            {("performance", "src/a.ts")}, "performance", " src/a.ts :10", False,
+            id="strips-whitespace-from-file-path",
+        ),
+    ])
+    def test_is_new(self, seen, type_, location, expected):
+        opp = self._make_opp(type_, location)
+        assert _is_new(opp, frozenset(seen)) is expected
+
+    def test_filters_large_batch_against_seen_signatures(self):
+        """1000 opportunities over 1000 files, half of them already seen."""
+        seen = frozenset(("performance", f"src/f{i}.ts") for i in range(0, 1000, 2))
+        opps = [self._make_opp("performance", f"src/f{i}.ts:{i}") for i in range(1000)]
+        assert sum(_is_new(o, seen) for o in opps) == 500
 
 
 class TestFormatSeenForFileSelection:
@@ -13,6 +13,7 @@ from runner.agent.types import AgentOpportunity, AgentPatch, PatchVariantResult
 from runner.validator.types import (
     AcceptanceVerdict,
     AttemptRecord,
+    BaselineResult,
     BenchmarkComparison,
     CandidateResult,
     CONFIDENCE_HIGH,
@@ -50,16 +51,25 @@ def _make_verdict(
     )
 
 
-def _make_candidate(accepted: bool, confidence: str = CONFIDENCE_MEDIUM, improvement_pct: float = 0.0) -> CandidateResult:
+def _make_candidate(
+    accepted: bool,
+    confidence: str = CONFIDENCE_MEDIUM,
+    improvement_pct: float = 0.0,
+    attempts: list[AttemptRecord] | None = None,
+) -> CandidateResult:
+    """Build a candidate; ``attempts`` replaces the default single attempt."""
     verdict = _make_verdict(accepted, confidence, improvement_pct)
-    attempt = AttemptRecord(
-        attempt_number=1,
-        patch_applied=True,
-        pipeline_result=None,
-        verdict=verdict,
-    )
+    if attempts is None:
+        attempts = [
+            AttemptRecord(
+                attempt_number=1,
+                patch_applied=True,
+                pipeline_result=None,
+                verdict=verdict,
+            )
+        ]
     return CandidateResult(
-        attempts=[attempt],
+        attempts=attempts,
         final_verdict=verdict,
         is_accepted=accepted,
     )
@@ -230,3 +240,41 @@ class TestBuildSelectionReason:
         assert "medium confidence" not in reason.lower()
         assert "high confidence" not in reason.lower()
         assert "low confidence" not in reason.lower()
+
+
+# ---------------------------------------------------------------------------
+# PatchVariantResult.to_dict
+# ---------------------------------------------------------------------------
+
+class TestPatchVariantToDict:
+    def test_two_attempts_for_flaky_rerun(self) -> None:
+        """metrics_after comes from the decisive (last) attempt after a flaky rerun."""
+        candidate = _make_candidate(
+            accepted=True,
+            attempts=[
+                AttemptRecord(
+                    attempt_number=1,
+                    patch_applied=True,
+                    pipeline_result=BaselineResult(is_success=False, error="flaky"),
+                    verdict=None,
+                ),
+                AttemptRecord(
+                    attempt_number=2,
+                    patch_applied=True,
+                    pipeline_result=BaselineResult(is_success=True),
+                    verdict=_make_verdict(True),
+                ),
+            ],
+        )
+
+        v = PatchVariantResult(
+            approach_index=0,
+            approach_description="A",
+            patch=_make_patch(),
+            candidate_result=candidate,
+        )
+        data = v.to_dict()
+
+        assert len(data["validation_result"]["attempts"]) == 2
+        assert data["metrics_after"]["is_success"] is True
+        assert data["metrics_after"]["error"] is None
@@ -2,6 +2,8 @@
 
 from unittest.mock import MagicMock
 
+import pytest
+
 from runner.agent.orchestrator import run_agent_cycle
 from runner.agent.patchgen import PatchGenTryRecord, PatchGenerationOutcome
 from runner.agent.types import AgentOpportunity, AgentPatch
@@ -55,6 +57,18 @@ def _make_patch() -> AgentPatch:
     )
 
 
+@pytest.fixture(scope="module")
+def opp() -> AgentOpportunity:
+    """Shared opportunity; the orchestrator only reads it."""
+    return _make_opportunity()
+
+
+@pytest.fixture(scope="module")
+def patch() -> AgentPatch:
+    """Shared patch; the orchestrator only reads it."""
+    return _make_patch()
+
+
 def _make_candidate_result() -> CandidateResult:
     steps = [
         StepResult(
@@ -103,12 +117,10 @@ def _make_candidate_result() -> CandidateResult:
     )
 
 
-async def test_emits_enriched_patch_and_validation_event_payloads(monkeypatch, tmp_path):
+async def test_emits_enriched_patch_and_validation_event_payloads(monkeypatch, tmp_path, opp, patch):
     (tmp_path / "src").mkdir()
     (tmp_path / "src" / "ui.tsx").write_text("const x = 1;\n")
 
-    opp = _make_opportunity()
-    patch = _make_patch()
     patch_outcome = PatchGenerationOutcome(
         success=True,
         patch=patch,
@@ -181,11 +193,10 @@ async def test_emits_enriched_patch_and_validation_event_payloads(monkeypatch, t
     assert verdict["benchmark_comparison"]["improvement_pct"] == 8.0
 
 
-async def test_emits_patch_failure_diagnostics_when_patchgen_returns_none(monkeypatch, tmp_path):
+async def test_emits_patch_failure_diagnostics_when_patchgen_returns_none(monkeypatch, tmp_path, opp):
     (tmp_path / "src").mkdir()
     (tmp_path / "src" / "ui.tsx").write_text("const x = 1;\n")
 
-    opp = _make_opportunity()
     failed_try_trace = _make_trace("patch parse trace")
     patch_outcome = PatchGenerationOutcome(
         success=False,
@@ -272,7 +283,7 @@ def _make_simple_candidate(confidence: str, accepted: bool = True) -> CandidateR
     return CandidateResult(attempts=[attempt], final_verdict=verdict, is_accepted=accepted)
 
 
-async def test_high_confidence_stops_after_first_approach(monkeypatch, tmp_path):
+async def test_high_confidence_stops_after_first_approach(monkeypatch, tmp_path, patch):
     """A high-confidence accepted variant should short-circuit; no further approaches tried."""
     (tmp_path / "src").mkdir()
     (tmp_path / "src" / "ui.tsx").write_text("const x = 1;\n")
@@ -286,7 +297,6 @@ async def test_high_confidence_stops_after_first_approach(monkeypatch, tmp_path)
         affected_lines=2,
         thinking_trace=_make_trace(),
     )
-    patch = _make_patch()
 
     async def fake_discover(**kw):
         return [opp]
@@ -317,7 +327,7 @@ async def test_high_confidence_stops_after_first_approach(monkeypatch, tmp_path)
     assert approaches_tried == 1, "High-confidence should stop after the first approach"
 
 
-async def test_medium_confidence_continues_to_next_approach(monkeypatch, tmp_path):
+async def test_medium_confidence_continues_to_next_approach(monkeypatch, tmp_path, patch):
     """A medium-confidence accepted variant should NOT stop the loop; approach 2 gets tried."""
     (tmp_path / "src").mkdir()
     (tmp_path / "src" / "ui.tsx").write_text("const x = 1;\n")
@@ -331,7 +341,6 @@ async def test_medium_confidence_continues_to_next_approach(monkeypatch, tmp_pat
         affected_lines=2,
         thinking_trace=_make_trace(),
     )
-    patch = _make_patch()
 
     call_count = {"n": 0}
 
@@ -370,14 +379,11 @@ async def test_medium_confidence_continues_to_next_approach(monkeypatch, tmp_pat
 # Cumulative patch validation tests
 # ---------------------------------------------------------------------------
 
-async def test_accepted_patch_is_applied_permanently(monkeypatch, tmp_path):
+async def test_accepted_patch_is_applied_permanently(monkeypatch, tmp_path, opp, patch):
     """After a patch is accepted, apply_diff should be called to make it permanent."""
     (tmp_path / "src").mkdir()
     (tmp_path / "src" / "ui.tsx").write_text("const x = 1;\n")
 
-    opp = _make_opportunity()
-    patch = _make_patch()
-
     async def fake_discover(**kw):
         return [opp]
 
@@ -419,14 +425,11 @@ async def test_accepted_patch_is_applied_permanently(monkeypatch, tmp_path):
     assert cumulative_events[0][2]["location"] == opp.location
 
 
-async def test_rejected_patch_is_not_applied(monkeypatch, tmp_path):
+async def test_rejected_patch_is_not_applied(monkeypatch, tmp_path, opp, patch):
     """When all variants are rejected, apply_diff should NOT be called."""
     (tmp_path / "src").mkdir()
     (tmp_path / "src" / "ui.tsx").write_text("const x = 1;\n")
 
-    opp = _make_opportunity()
-    patch = _make_patch()
-
     async def fake_discover(**kw):
         return [opp]
 
@@ -460,16 +463,13 @@ async def test_rejected_patch_is_not_applied(monkeypatch, tmp_path):
     assert len(apply_calls) == 0, "apply_diff should not be called for rejected patches"
 
 
-async def test_apply_failure_downgrades_to_rejected(monkeypatch, tmp_path):
+async def test_apply_failure_downgrades_to_rejected(monkeypatch, tmp_path, opp, patch):
     """When apply_diff raises PatchApplyError, the candidate should be downgraded."""
     from runner.validator.patch_applicator import PatchApplyError
 
     (tmp_path / "src").mkdir()
     (tmp_path / "src" / "ui.tsx").write_text("const x = 1;\n")
 
-    opp = _make_opportunity()
-    patch = _make_patch()
-
     async def fake_discover(**kw):
         return [opp]
 
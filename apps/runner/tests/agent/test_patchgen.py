@@ -14,6 +14,7 @@ import pytest
 from runner.agent.patchgen import (
     PATCHGEN_FAILURE_STAGE_JSON_PARSE,
     PATCHGEN_FAILURE_STAGE_SEARCH_NOT_FOUND,
+    PatchGenerationOutcome,
     _build_correction_feedback,
     _parse_file_from_location,
     _parse_patch_response,
@@ -37,6 +38,19 @@ _UTILS_TS_CONTENT = "const x = 1;\nconst re = /abc/;\nreturn x;\n"
 _BIG_FILE_CONTENT = "code\n"
 
 
+@pytest.fixture(scope="module")
+def utils_repo(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Repo with src/utils.ts, shared by tests that only read it.
+
+    Patch generation never writes to the repo, so one copy per module is enough.
+    """
+    repo = tmp_path_factory.mktemp("utils_repo")
+    src = repo / "src"
+    src.mkdir()
+    (src / "utils.ts").write_text(_UTILS_TS_CONTENT)
+    return repo
+
+
 def _make_config() -> LLMConfig:
     return LLMConfig(provider="anthropic", model="claude-sonnet-4-5", api_key="test")
 
@@ -434,16 +448,12 @@ class TestParsePatchResponse:
 # ---------------------------------------------------------------------------
 
 class TestGenerateAgentPatch:
-    async def test_returns_patch_for_valid_response(self, tmp_path: Path) -> None:
-        src = tmp_path / "src"
-        src.mkdir()
-        (src / "utils.ts").write_text(_UTILS_TS_CONTENT)
-
+    async def test_returns_patch_for_valid_response(self, utils_repo: Path) -> None:
         mock_provider = MagicMock()
         mock_provider.complete = AsyncMock(return_value=_make_response())
 
         opp = _make_opportunity("src/utils.ts:10")
-        result = await generate_agent_patch(opp, tmp_path, mock_provider, _make_config())
+        result = await generate_agent_patch(opp, utils_repo, mock_provider, _make_config())
 
         assert result is not None
         assert result.diff != ""
@@ -489,12 +499,8 @@ class TestGenerateAgentPatch:
             assert result.estimated_lines_changed <= 200
 
     async def test_approach_override_is_used_instead_of_opportunity_approach(
-        self, tmp_path: Path,
+        self, utils_repo: Path,
     ) -> None:
-        src = tmp_path / "src"
-        src.mkdir()
-        (src / "utils.ts").write_text(_UTILS_TS_CONTENT)
-
         captured_prompts: list[str] = []
 
         async def fake_complete(messages, config):
@@ -508,7 +514,7 @@ class TestGenerateAgentPatch:
 
         opp = _make_opportunity("src/utils.ts:10")
         await generate_agent_patch(
-            opp, tmp_path, mock_provider, _make_config(),
+            opp, utils_repo, mock_provider, _make_config(),
             approach_override="my custom override approach",
         )
 
@@ -521,32 +527,36 @@ class TestGenerateAgentPatch:
 # Integration tests: generate_agent_patch_with_diagnostics
 # ---------------------------------------------------------------------------
 
-class TestGenerateAgentPatchWithDiagnostics:
-    async def test_success_returns_patch_and_try_diagnostics(self, tmp_path: Path) -> None:
-        src = tmp_path / "src"
-        src.mkdir()
-        (src / "utils.ts").write_text(_UTILS_TS_CONTENT)
-
-        mock_provider = MagicMock()
-        mock_provider.complete = AsyncMock(return_value=_make_response())
+@pytest.fixture(scope="module")
+async def valid_outcome(utils_repo: Path) -> PatchGenerationOutcome:
+    """Diagnostics outcome for a single valid LLM response, generated once."""
+    mock_provider = MagicMock()
+    mock_provider.complete = AsyncMock(return_value=_make_response())
+
+    return await generate_agent_patch_with_diagnostics(
+        _make_opportunity("src/utils.ts:10"),
+        utils_repo,
+        mock_provider,
+        _make_config(),
+    )
 
-        outcome = await generate_agent_patch_with_diagnostics(
-            _make_opportunity("src/utils.ts:10"),
-            tmp_path,
-            mock_provider,
-            _make_config(),
-        )
 
-        assert outcome.success is True
-        assert outcome.patch is not None
-        assert outcome.failure_stage is None
-        assert len(outcome.tries) == 1
-        t = outcome.tries[0]
+class TestGenerateAgentPatchWithDiagnostics:
+    def test_success_returns_patch(self, valid_outcome: PatchGenerationOutcome) -> None:
+        assert valid_outcome.success is True
+        assert valid_outcome.patch is not None
+        assert valid_outcome.failure_stage is None
+
+    def test_success_records_single_try(self, valid_outcome: PatchGenerationOutcome) -> None:
+        assert len(valid_outcome.tries) == 1
+        t = valid_outcome.tries[0]
         assert t.success is True
         assert t.patch is not None
-        assert t.patch.diff.startswith("--- a/src/utils.ts")
         assert t.patch_trace is not None
 
+    def test_success_diff_is_unified(self, valid_outcome: PatchGenerationOutcome) -> None:
+        assert valid_outcome.tries[0].patch.diff.startswith("--- a/src/utils.ts")
+
     async def test_json_parse_failure_retries_and_records_two_tries(self, tmp_path: Path) -> None:
         """json_parse is retryable — the loop makes 2 attempts and records both."""
         (tmp_path / "a.ts").write_text("const x = 1;\n")
@@ -646,12 +656,8 @@ class TestGenerateAgentPatchWithDiagnostics:
         assert outcome.tries[0].failure_stage == PATCHGEN_FAILURE_STAGE_SEARCH_NOT_FOUND
         assert outcome.tries[1].failure_stage == PATCHGEN_FAILURE_STAGE_SEARCH_NOT_FOUND
 
-    async def test_search_not_found_retry_succeeds_on_second_attempt(self, tmp_path: Path) -> None:
+    async def test_search_not_found_retry_succeeds_on_second_attempt(self, utils_repo: Path) -> None:
         """If the second attempt produces a valid patch, the outcome is success."""
-        src = tmp_path / "src"
-        src.mkdir()
-        (src / "utils.ts").write_text(_UTILS_TS_CONTENT)
-
         bad_response = LLMResponse(
             content=json.dumps({
                 "edits": [{"file": "src/utils.ts", "search": "WRONG TEXT\n", "replace": "x\n"}],
@@ -667,7 +673,7 @@ class TestGenerateAgentPatchWithDiagnostics:
 
         outcome = await generate_agent_patch_with_diagnostics(
             _make_opportunity("src/utils.ts:10"),
-            tmp_path,
+            utils_repo,
             mock_provider,
             _make_config(),
         )
@@ -678,12 +684,8 @@ class TestGenerateAgentPatchWithDiagnostics:
         assert outcome.tries[0].failure_stage == PATCHGEN_FAILURE_STAGE_SEARCH_NOT_FOUND
         assert outcome.tries[1].success is True
 
-    async def test_json_parse_retry_succeeds_on_second_attempt(self, tmp_path: Path) -> None:
+    async def test_json_parse_retry_succeeds_on_second_attempt(self, utils_repo: Path) -> None:
         """If the second attempt produces valid JSON, the outcome is success."""
-        src = tmp_path / "src"
-        src.mkdir()
-        (src / "utils.ts").write_text(_UTILS_TS_CONTENT)
-
         bad_response = LLMResponse(content="not valid json at all", thinking_trace=_make_trace())
         good_response = _make_response()
 
@@ -692,7 +694,7 @@ class TestGenerateAgentPatchWithDiagnostics:
 
         outcome = await generate_agent_patch_with_diagnostics(
             _make_opportunity("src/utils.ts:10"),
-            tmp_path,
+            utils_repo,
             mock_provider,
             _make_config(),
         )
@@ -703,12 +705,8 @@ class TestGenerateAgentPatchWithDiagnostics:
         assert outcome.tries[0].failure_stage == PATCHGEN_FAILURE_STAGE_JSON_PARSE
         assert outcome.tries[1].success is True
 
-    async def test_retry_prompt_includes_corrective_feedback(self, tmp_path: Path) -> None:
+    async def test_retry_prompt_includes_corrective_feedback(self, utils_repo: Path) -> None:
         """The second LLM call receives a prompt augmented with corrective instructions."""
-        src = tmp_path / "src"
-        src.mkdir()
-        (src / "utils.ts").write_text(_UTILS_TS_CONTENT)
-
         bad_response = LLMResponse(
             content=json.dumps({
                 "edits": [{"file": "src/utils.ts", "search": "WRONG\n", "replace": "x\n"}],
@@ -740,7 +738,7 @@ class TestGenerateAgentPatchWithDiagnostics:
 
         await generate_agent_patch_with_diagnostics(
             _make_opportunity("src/utils.ts:10"),
-            tmp_path,
+            utils_repo,
             mock_provider,
             _make_config(),
         )
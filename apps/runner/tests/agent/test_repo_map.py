@@ -5,6 +5,23 @@ from pathlib import Path
 from runner.agent.repo_map import build_repo_map, MAX_DEPTH, SKIP_DIRS
 
 
+@pytest.fixture(scope="module")
+def populated_map(tmp_path_factory) -> str:
+    """Map of one tree holding both skipped and listed files, built once.
+
+    Tests that only check which entries are filtered in or out read this;
+    tests that need a specific shape keep their own tmp_path.
+    """
+    root = tmp_path_factory.mktemp("repo_map_tree")
+    (root / "node_modules").mkdir()
+    (root / "node_modules" / "lodash.js").write_text("module")
+    (root / "dist").mkdir()
+    (root / "dist" / "bundle.js").write_text("minified")
+    (root / "src").mkdir()
+    (root / "src" / "service.ts").write_text("export class S {}")
+    return build_repo_map(root)
+
+
 class TestBuildRepoMap:
     def test_returns_string(self, tmp_path: Path) -> None:
         result = build_repo_map(tmp_path)
@@ -21,37 +38,28 @@ class TestBuildRepoMap:
         assert "utils.ts" in result
         assert "2 lines" in result
 
-    def test_includes_js_files(self, tmp_path: Path) -> None:
-        (tmp_path / "index.js").write_text("module.exports = {};")
-        result = build_repo_map(tmp_path)
-        assert "index.js" in result
-
-    def test_includes_tsx_files(self, tmp_path: Path) -> None:
-        (tmp_path / "App.tsx").write_text("export default function App() {}")
-        result = build_repo_map(tmp_path)
-        assert "App.tsx" in result
+    def test_skips_node_modules(self, populated_map: str) -> None:
+        assert "lodash.js" not in populated_map
 
-    def test_skips_node_modules(self, tmp_path: Path) -> None:
-        nm = tmp_path / "node_modules"
-        nm.mkdir()
-        (nm / "lodash.js").write_text("module")
-        result = build_repo_map(tmp_path)
-        assert "lodash.js" not in result
+    def test_skips_dist(self, populated_map: str) -> None:
+        assert "bundle.js" not in populated_map
 
-    def test_skips_dist(self, tmp_path: Path) -> None:
-        dist = tmp_path / "dist"
-        dist.mkdir()
-        (dist / "bundle.js").write_text("minified")
+    @pytest.mark.parametrize("filename, content", [
+        ("index.js", "module.exports = {};"),
+        ("App.tsx", "export default function App() {}"),
+        ("main.go", "package main\n\nfunc main() {}\n"),
+        ("lib.rs", "fn main() {}\n"),
+        ("App.java", "public class App {}\n"),
+        ("app.rb", "puts 'hi'\n"),
+    ])
+    def test_includes_source_file(self, tmp_path: Path, filename: str, content: str) -> None:
+        (tmp_path / filename).write_text(content)
         result = build_repo_map(tmp_path)
-        assert "bundle.js" not in result
+        assert filename in result
 
-    def test_includes_subdirectory_files(self, tmp_path: Path) -> None:
-        src = tmp_path / "src"
-        src.mkdir()
-        (src / "service.ts").write_text("export class S {}")
-        result = build_repo_map(tmp_path)
-        assert "src" in result
-        assert "service.ts" in result
+    def test_includes_subdirectory_files(self, populated_map: str) -> None:
+        assert "src" in populated_map
+        assert "service.ts" in populated_map
 
     def test_respects_depth_limit(self, tmp_path: Path) -> None:
         # Create a deep nested structure
@@ -80,23 +88,3 @@ class TestBuildRepoMap:
         result = build_repo_map(tmp_path)
         assert "main.py" in result
         assert "1 lines" in result
-
-    def test_includes_go_files(self, tmp_path: Path) -> None:
-        (tmp_path / "main.go").write_text("package main\n\nfunc main() {}\n")
-        result = build_repo_map(tmp_path)
-        assert "main.go" in result
-
-    def test_includes_rust_files(self, tmp_path: Path) -> None:
-        (tmp_path / "lib.rs").write_text("fn main() {}\n")
-        result = build_repo_map(tmp_path)
-        assert "lib.rs" in result
-
-    def test_includes_java_files(self, tmp_path: Path) -> None:
-        (tmp_path / "App.java").write_text("public class App {}\n")
-        result = build_repo_map(tmp_path)
-        assert "App.java" in result
-
-    def test_includes_ruby_files(self, tmp_path: Path) -> None:
-        (tmp_path / "app.rb").write_text("puts 'hi'\n")
-        result = build_repo_map(tmp_path)
-        assert "app.rb" in result
@@ -2,6 +2,7 @@
 
 Each fixture mimics a real-world repo structure. The detector should
 produce the expected package manager, framework, and commands.
+detect() runs once per fixture repo; the tests only read its result.
 """
 
 from pathlib import Path
@@ -10,43 +11,64 @@ import pytest
 
 from runner.detector import detect
 
-FIXTURES_DIR = Path(__file__).resolve().parents[4] / "fixtures" / "repos"
+FIXTURES_DIR = Path(__file__).absolute().parents[4] / "fixtures" / "repos"
+
+_NEXTJS_APP = FIXTURES_DIR / "nextjs-app"
+_NESTJS_API = FIXTURES_DIR / "nestjs-api"
+_EXPRESS_SERVER = FIXTURES_DIR / "express-server"
+_REACT_VITE = FIXTURES_DIR / "react-vite"
+
+
+@pytest.fixture(scope="module")
+def nextjs_result():
+    return detect(_NEXTJS_APP)
+
+
+@pytest.fixture(scope="module")
+def nestjs_result():
+    return detect(_NESTJS_API)
+
+
+@pytest.fixture(scope="module")
+def express_result():
+    return detect(_EXPRESS_SERVER)
+
+
+@pytest.fixture(scope="module")
+def react_vite_result():
+    return detect(_REACT_VITE)
 
 
 class TestNextjsFixture:
     """Detection results for a Next.js app with npm and vitest."""
 
-    @pytest.fixture
-    def result(self):
-        return detect(FIXTURES_DIR / "nextjs-app")
-
-    def test_package_manager(self, result):
-        assert result.package_manager == "npm"
+    def test_package_manager(self, nextjs_result):
+        assert nextjs_result.package_manager == "npm"
 
-    def test_install_cmd(self, result):
-        assert result.install_cmd == "npm ci"
+    def test_install_cmd(self, nextjs_result):
+        assert nextjs_result.install_cmd == "npm ci"
 
-    def test_build_cmd(self, result):
-        assert "build" in result.build_cmd
+    def test_build_cmd(self, nextjs_result):
+        assert "build" in nextjs_result.build_cmd
 
-    def test_test_cmd(self, result):
-        assert "test" in result.test_cmd
+    def test_test_cmd(self, nextjs_result):
+        assert "test" in nextjs_result.test_cmd
 
-    def test_typecheck_cmd(self, result):
-        assert result.typecheck_cmd is not None
-        assert "typecheck" in result.typecheck_cmd
+    def test_typecheck_cmd(self, nextjs_result):
+        assert nextjs_result.typecheck_cmd is not None
+        assert "typecheck" in nextjs_result.typecheck_cmd
 
-    def test_framework(self, result):
-        assert result.framework == "nextjs"
+    def test_framework(self, nextjs_result):
+        assert nextjs_result.framework == "nextjs"
 
-    def test_confidence_above_threshold(self, result):
-        assert result.confidence >= 0.5
+    def test_confidence_above_threshold(self, nextjs_result):
+        assert nextjs_result.confidence >= 0.5
 
-    def test_evidence_is_populated(self, result):
-        assert len(result.evidence) >= 4
+    def test_evidence_is_populated(self, nextjs_result):
+        assert len(nextjs_result.evidence) >= 4
 
-    def test_to_dict_has_all_keys(self, result):
-        d = result.to_dict()
+    def test_to_dict_has_all_keys(self, nextjs_result):
+        d = nextjs_result.to_dict()
         expected_keys = {
             "package_manager", "install_cmd", "build_cmd",
             "test_cmd", "typecheck_cmd", "bench_cmd", "framework",
@@ -58,80 +80,68 @@ class TestNextjsFixture:
 class TestNestjsFixture:
     """Detection results for a NestJS API with pnpm and jest."""
 
-    @pytest.fixture
-    def result(self):
-        return detect(FIXTURES_DIR / "nestjs-api")
+    def test_package_manager(self, nestjs_result):
+        assert nestjs_result.package_manager == "pnpm"
 
-    def test_package_manager(self, result):
-        assert result.package_manager == "pnpm"
+    def test_install_cmd(self, nestjs_result):
+        assert "pnpm" in nestjs_result.install_cmd
+        assert "frozen-lockfile" in nestjs_result.install_cmd
 
-    def test_install_cmd(self, result):
-        assert "pnpm" in result.install_cmd
-        assert "frozen-lockfile" in result.install_cmd
+    def test_build_cmd(self, nestjs_result):
+        assert "build" in nestjs_result.build_cmd
 
-    def test_build_cmd(self, result):
-        assert "build" in result.build_cmd
+    def test_test_cmd(self, nestjs_result):
+        assert "test" in nestjs_result.test_cmd
 
-    def test_test_cmd(self, result):
-        assert "test" in result.test_cmd
+    def test_framework(self, nestjs_result):
+        assert nestjs_result.framework == "nestjs"
 
-    def test_framework(self, result):
-        assert result.framework == "nestjs"
-
-    def test_confidence_above_threshold(self, result):
-        assert result.confidence >= 0.5
+    def test_confidence_above_threshold(self, nestjs_result):
+        assert nestjs_result.confidence >= 0.5
 
 
 class TestExpressFixture:
     """Detection results for an Express server with yarn and mocha."""
 
-    @pytest.fixture
-    def result(self):
-        return detect(FIXTURES_DIR / "express-server")
-
-    def test_package_manager(self, result):
-        assert result.package_manager == "yarn"
+    def test_package_manager(self, express_result):
+        assert express_result.package_manager == "yarn"
 
-    def test_install_cmd(self, result):
-        assert "yarn" in result.install_cmd
-        assert "frozen-lockfile" in result.install_cmd
+    def test_install_cmd(self, express_result):
+        assert "yarn" in express_result.install_cmd
+        assert "frozen-lockfile" in express_result.install_cmd
 
-    def test_test_cmd(self, result):
-        assert "test" in result.test_cmd
+    def test_test_cmd(self, express_result):
+        assert "test" in express_result.test_cmd
 
-    def test_framework(self, result):
-        assert result.framework == "express"
+    def test_framework(self, express_result):
+        assert express_result.framework == "express"
 
-    def test_no_typecheck(self, result):
+    def test_no_typecheck(self, express_result):
         """Express fixture has no typecheck script."""
-        assert result.typecheck_cmd is None
+        assert express_result.typecheck_cmd is None
 
-    def test_confidence_above_threshold(self, result):
-        assert result.confidence >= 0.5
+    def test_confidence_above_threshold(self, express_result):
+        assert express_result.confidence >= 0.5
 
 
 class TestReactViteFixture:
     """Detection results for a React Vite app with npm and vitest."""
 
-    @pytest.fixture
-    def result(self):
-        return detect(FIXTURES_DIR / "react-vite")
-
-    def test_package_manager(self, result):
-        assert result.package_manager == "npm"
+    def test_package_manager(self, react_vite_result):
+        assert react_vite_result.package_manager == "npm"
 
-    def test_install_cmd(self, result):
-        assert result.install_cmd == "npm ci"
+    def test_install_cmd(self, react_vite_result):
+        assert react_vite_result.install_cmd == "npm ci"
 
-    def test_build_cmd(self, result):
-        assert "build" in result.build_cmd
+    def test_build_cmd(self, react_vite_result):
+        assert "build" in react_vite_result.build_cmd
 
-    def test_test_cmd(self, result):
-        assert "test" in result.test_cmd
+    def test_test_cmd(self, react_vite_result):
+        assert "test" in react_vite_result.test_cmd
 
-    def test_framework(self, result):
+    def test_framework(self, react_vite_result):
         # Vite is detected since it appears before react in the indicator list
-        assert result.framework == "react-vite"
+        assert react_vite_result.framework == "react-vite"
 
-    def test_confidence_above_threshold(self, result):
-        assert result.confidence >= 0.5
+    def test_confidence_above_threshold(self, react_vite_result):
+        assert react_vite_result.confidence >= 0.5
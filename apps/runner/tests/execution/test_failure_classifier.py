@@ -1,9 +1,14 @@
 """Tests for baseline failure signature classification."""
 
+import pytest
+
 from runner.execution.failure_classifier import classify_pipeline_failure
 from runner.validator.types import BaselineResult, StepResult
 
 
+_WASM_OOM_STDERR = "RangeError: WebAssembly.instantiate(): Out of memory"
+
+
 def test_classifies_missing_dev_dependencies() -> None:
     result = BaselineResult(
         steps=[
@@ -22,21 +27,73 @@ def test_classifies_missing_dev_dependencies() -> None:
     assert classified.reason_code.value == "missing_dev_dependencies"
 
 
-def test_classifies_wrapper_missing() -> None:
+@pytest.mark.parametrize("step_name, command, stderr, expected", [
+    pytest.param(
+        "install", "./gradlew dependencies",
+        "./gradlew: No such file or directory",
+        "wrapper_missing",
+        id="wrapper-missing",
+    ),
+    pytest.param(
+        "build", "./gradlew build",
+        "java.lang.OutOfMemoryError: Java heap space",
+        "oom",
+        id="jvm-java-heap-space",
+    ),
+    pytest.param(
+        "test", "./gradlew test",
+        "java.lang.OutOfMemoryError: GC overhead limit exceeded",
+        "concurrency_oom",
+        id="jvm-gc-overhead-in-test",
+    ),
+    pytest.param(
+        "build", "cargo build --release",
+        "error: linking with `cc` failed: linker command failed: cannot allocate memory",
+        "oom",
+        id="rust-linker-out-of-memory",
+    ),
+    pytest.param(
+        "test", "ctest --test-dir build",
+        "collect2: fatal error: ld terminated with signal 9 [Killed]",
+        "concurrency_oom",
+        id="cpp-linker-killed-in-test",
+    ),
+    pytest.param(
+        "test", "pytest -q",
+        "ModuleNotFoundError: No module named 'pytest'",
+        "missing_dev_dependencies",
+        id="python-missing-pytest",
+    ),
+    pytest.param(
+        "test", "bundle exec rspec",
+        "cannot load such file -- rspec",
+        "missing_dev_dependencies",
+        id="ruby-missing-rspec",
+    ),
+    pytest.param(
+        "test", "go test ./...",
+        "missing go.sum entry for module providing package",
+        "install_failed",
+        id="go-missing-go-sum-entry",
+    ),
+])
+def test_classifies_single_failed_step(
+    step_name: str, command: str, stderr: str, expected: str,
+) -> None:
     result = BaselineResult(
         steps=[
             StepResult(
-                name="install",
-                command="./gradlew dependencies",
+                name=step_name,
+                command=command,
                 exit_code=1,
                 duration_seconds=0.01,
-                stderr="./gradlew: No such file or directory",
+                stderr=stderr,
             )
         ],
         is_success=False,
     )
     classified = classify_pipeline_failure(result)
-    assert classified.reason_code.value == "wrapper_missing"
+    assert classified.reason_code.value == expected
 
 
 def test_prefers_critical_test_failure_over_noncritical_build_failure() -> None:
@@ -47,14 +104,14 @@ def test_prefers_critical_test_failure_over_noncritical_build_failure() -> None:
                 command="npm run build",
                 exit_code=1,
                 duration_seconds=0.01,
-                stderr="RangeError: WebAssembly.instantiate(): Out of memory",
+                stderr=_WASM_OOM_STDERR,
             ),
             StepResult(
                 name="test",
                 command="npm run test",
                 exit_code=1,
                 duration_seconds=0.01,
-                stderr="RangeError: WebAssembly.instantiate(): Out of memory",
+                stderr=_WASM_OOM_STDERR,
             ),
         ],
         is_success=False,
@@ -62,122 +119,3 @@ def test_prefers_critical_test_failure_over_noncritical_build_failure() -> None:
     classified = classify_pipeline_failure(result)
     assert classified.step_name == "test"
     assert classified.reason_code.value == "concurrency_oom"
-
-
-def test_classifies_jvm_java_heap_space_as_oom() -> None:
-    result = BaselineResult(
-        steps=[
-            StepResult(
-                name="build",
-                command="./gradlew build",
-                exit_code=1,
-                duration_seconds=0.01,
-                stderr="java.lang.OutOfMemoryError: Java heap space",
-            )
-        ],
-        is_success=False,
-    )
-    classified = classify_pipeline_failure(result)
-    assert classified.reason_code.value == "oom"
-
-
-def test_classifies_jvm_gc_overhead_in_test_as_concurrency_oom() -> None:
-    result = BaselineResult(
-        steps=[
-            StepResult(
-                name="test",
-                command="./gradlew test",
-                exit_code=1,
-                duration_seconds=0.01,
-                stderr="java.lang.OutOfMemoryError: GC overhead limit exceeded",
-            )
-        ],
-        is_success=False,
-    )
-    classified = classify_pipeline_failure(result)
-    assert classified.reason_code.value == "concurrency_oom"
-
-
-def test_classifies_rust_linker_out_of_memory_as_oom() -> None:
-    result = BaselineResult(
-        steps=[
-            StepResult(
-                name="build",
-                command="cargo build --release",
-                exit_code=1,
-                duration_seconds=0.01,
-                stderr="error: linking with `cc` failed: linker command failed: cannot allocate memory",
-            )
-        ],
-        is_success=False,
-    )
-    classified = classify_pipeline_failure(result)
-    assert classified.reason_code.value == "oom"
-
-
-def test_classifies_cpp_linker_signal_killed_in_test_as_concurrency_oom() -> None:
-    result = BaselineResult(
-        steps=[
-            StepResult(
-                name="test",
-                command="ctest --test-dir build",
-                exit_code=1,
-                duration_seconds=0.01,
-                stderr="collect2: fatal error: ld terminated with signal 9 [Killed]",
-            )
-        ],
-        is_success=False,
-    )
-    classified = classify_pipeline_failure(result)
-    assert classified.reason_code.value == "concurrency_oom"
-
-
-def test_classifies_python_missing_pytest_module_as_missing_dev_dependencies() -> None:
-    result = BaselineResult(
-        steps=[
-            StepResult(
-                name="test",
-                command="pytest -q",
-                exit_code=1,
-                duration_seconds=0.01,
-                stderr="ModuleNotFoundError: No module named 'pytest'",
-            )
-        ],
-        is_success=False,
-    )
-    classified = classify_pipeline_failure(result)
-    assert classified.reason_code.value == "missing_dev_dependencies"
-
-
-def test_classifies_ruby_missing_rspec_as_missing_dev_dependencies() -> None:
-    result = BaselineResult(
-        steps=[
-            StepResult(
-                name="test",
-                command="bundle exec rspec",
-                exit_code=1,
-                duration_seconds=0.01,
-                stderr="cannot load such file -- rspec",
-            )
-        ],
-        is_success=False,
-    )
-    classified = classify_pipeline_failure(result)
-    assert classified.reason_code.value == "missing_dev_dependencies"
-
-
-def test_classifies_go_missing_go_sum_entry_as_install_failed() -> None:
-    result = BaselineResult(
-        steps=[
-            StepResult(
-                name="test",
-                command="go test ./...",
-                exit_code=1,
-                duration_seconds=0.01,
-                stderr="missing go.sum entry for module providing package",
-            )
-        ],
-        is_success=False,
-    )
-    classified = classify_pipeline_failure(result)
-    assert classified.reason_code.value == "install_failed"
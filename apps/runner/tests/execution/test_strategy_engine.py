@@ -8,6 +8,9 @@ from runner.execution.strategy_types import ExecutionMode, StrategySettings
 from runner.validator.types import StepResult
 
 
+_WASM_OOM_STDERR = "RangeError: WebAssembly.instantiate(): Out of memory"
+
+
 def _ok_step(name: str, command: str) -> StepResult:
     return StepResult(name=name, command=command, exit_code=0, duration_seconds=0.01)
 
@@ -73,7 +76,7 @@ def test_node_test_oom_retries_with_vitest_throttle(tmp_path: Path) -> None:
                 command=command,
                 exit_code=1,
                 duration_seconds=0.02,
-                stderr="RangeError: WebAssembly.instantiate(): Out of memory",
+                stderr=_WASM_OOM_STDERR,
             )
         return _ok_step(name, command)
 
@@ -118,7 +121,7 @@ def test_node_retries_when_build_fails_before_test_with_oom(tmp_path: Path) -> N
                 command=command,
                 exit_code=1,
                 duration_seconds=0.02,
-                stderr="RangeError: WebAssembly.instantiate(): Out of memory",
+                stderr=_WASM_OOM_STDERR,
             )
         if name == "test" and len(test_calls) == 1:
             return StepResult(
@@ -126,7 +129,7 @@ def test_node_retries_when_build_fails_before_test_with_oom(tmp_path: Path) -> N
                 command=command,
                 exit_code=1,
                 duration_seconds=0.02,
-                stderr="RangeError: WebAssembly.instantiate(): Out of memory",
+                stderr=_WASM_OOM_STDERR,
             )
         return _ok_step(name, command)
 
@@ -178,6 +181,35 @@ def test_node_strict_install_env_keeps_optional_native_dependencies_enabled(tmp_
     assert install_env.get("NPM_CONFIG_OMIT") == ""
 
 
+def test_step_envs_carry_overrides_only(tmp_path: Path, monkeypatch) -> None:
+    """run_step() merges over os.environ, so plans must not copy it per step."""
+    monkeypatch.setenv("EVOBASE_TEST_INHERITED", "1")
+    detection = DetectionResult(
+        language="javascript",
+        package_manager="npm",
+        install_cmd="npm ci",
+        build_cmd="npm run build",
+        test_cmd="npm test",
+    )
+    calls: list[tuple[str, str, dict | None]] = []
+
+    def fake_run_step(name, command, cwd, timeout=300, env=None):
+        calls.append((name, command, env))
+        return _ok_step(name, command)
+
+    run_with_strategy(
+        repo_dir=tmp_path,
+        detection=detection,
+        run_step=fake_run_step,
+        strategy_settings=StrategySettings(mode=ExecutionMode.STRICT, max_attempts=1),
+    )
+
+    assert [name for name, _, _ in calls] == ["install", "build", "test"]
+    for _, _, env in calls:
+        assert env is not None
+        assert "EVOBASE_TEST_INHERITED" not in env
+
+
 def test_node_oom_retry_disables_js_rlimit_and_throttles_vitest(tmp_path: Path) -> None:
     (tmp_path / "package.json").write_text(
         '{"scripts":{"test":"vitest run"}}',
@@ -201,7 +233,7 @@ def test_node_oom_retry_disables_js_rlimit_and_throttles_vitest(tmp_path: Path)
                 command=command,
                 exit_code=1,
                 duration_seconds=0.01,
-                stderr="RangeError: WebAssembly.instantiate(): Out of memory",
+                stderr=_WASM_OOM_STDERR,
             )
         return _ok_step(name, command)
 
@@ -113,12 +113,11 @@ def test_get_framework_focus_unknown_returns_generic() -> None:
     assert "JavaScript" in focus or "TypeScript" in focus
 
 
-def test_all_focus_strings_contain_rule_catalog() -> None:
+@pytest.mark.parametrize("fw", sorted({fw for fw, _ in _FRAMEWORK_CASES}))
+def test_focus_string_contains_rule_catalog(fw: str) -> None:
     """Every named framework's FOCUS string contains the structured rule catalog block."""
-    named_frameworks = [fw for fw, _ in _FRAMEWORK_CASES]
-    for fw in set(named_frameworks):
-        focus = get_framework_focus(fw)
-        assert "Rule " in focus or "Anti-pattern" in focus, (
-            f"Framework {fw!r} focus string appears to be missing the rule catalog block.\n"
-            f"First 200 chars: {focus[:200]}"
-        )
+    focus = get_framework_focus(fw)
+    assert "Rule " in focus or "Anti-pattern" in focus, (
+        f"Framework {fw!r} focus string appears to be missing the rule catalog block.\n"
+        f"First 200 chars: {focus[:200]}"
+    )
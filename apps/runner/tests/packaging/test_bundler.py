@@ -5,10 +5,15 @@ import json
 import pytest
 
 from runner.packaging.bundler import bundle_artifacts
+from runner.packaging.types import ArtifactBundle
 from runner.validator.types import BaselineResult, StepResult
 
 
-@pytest.fixture
+def _by_name(bundles: list[ArtifactBundle]) -> dict[str, ArtifactBundle]:
+    return {b.filename: b for b in bundles}
+
+
+@pytest.fixture(scope="module")
 def sample_result():
     return BaselineResult(
         steps=[
@@ -30,80 +35,87 @@ def sample_result():
     )
 
 
+@pytest.fixture(scope="module")
+def sample_bundles(sample_result):
+    """Bundle the shared sample result once; none of the tests mutate it."""
+    return bundle_artifacts("run-123", "repo-456", sample_result)
+
+
+@pytest.fixture(scope="module")
+def bundles_by_name(sample_bundles):
+    return _by_name(sample_bundles)
+
+
+@pytest.fixture(scope="module")
+def baseline_data(bundles_by_name):
+    return json.loads(bundles_by_name["baseline.json"].content)
+
+
+@pytest.fixture(scope="module")
+def trace_data(bundles_by_name):
+    return json.loads(bundles_by_name["trace.json"].content)
+
+
+@pytest.fixture(scope="module")
+def long_output_trace_data():
+    result = BaselineResult(
+        steps=[
+            StepResult(
+                name="test", command="npm test", exit_code=0,
+                duration_seconds=10.0,
+                stdout="x" * 1000,
+                stderr="y" * 1000,
+            ),
+        ],
+        is_success=True,
+    )
+    bundles = bundle_artifacts("run-1", "repo-1", result)
+    return json.loads(_by_name(bundles)["trace.json"].content)
+
+
 class TestBundleArtifacts:
-    def test_produces_three_artifacts(self, sample_result):
-        bundles = bundle_artifacts("run-123", "repo-456", sample_result)
-        assert len(bundles) == 3
+    def test_produces_expected_artifact_set(self, sample_bundles):
+        assert len(sample_bundles) == 3
 
-    def test_artifact_filenames(self, sample_result):
-        bundles = bundle_artifacts("run-123", "repo-456", sample_result)
-        filenames = {b.filename for b in bundles}
-        assert filenames == {"baseline.json", "logs.txt", "trace.json"}
+        type_map = {b.filename: b.artifact_type for b in sample_bundles}
+        assert type_map == {
+            "baseline.json": "baseline",
+            "logs.txt": "log",
+            "trace.json": "trace",
+        }
 
-    def test_storage_paths_follow_convention(self, sample_result):
-        bundles = bundle_artifacts("run-123", "repo-456", sample_result)
-        for bundle in bundles:
+        for bundle in sample_bundles:
             assert bundle.storage_path.startswith("repos/repo-456/runs/run-123/")
 
-    def test_baseline_json_is_valid(self, sample_result):
-        bundles = bundle_artifacts("run-123", "repo-456", sample_result)
-        baseline_bundle = next(b for b in bundles if b.filename == "baseline.json")
-        data = json.loads(baseline_bundle.content)
-
-        assert data["is_success"] is True
-        assert len(data["steps"]) == 3
-        assert data["total_duration_seconds"] == 25.5
+    def test_baseline_json_is_valid(self, baseline_data):
+        assert baseline_data["is_success"] is True
+        assert len(baseline_data["steps"]) == 3
+        assert baseline_data["total_duration_seconds"] == 25.5
 
-    def test_logs_contain_step_output(self, sample_result):
-        bundles = bundle_artifacts("run-123", "repo-456", sample_result)
-        logs_bundle = next(b for b in bundles if b.filename == "logs.txt")
+    def test_logs_contain_step_output(self, bundles_by_name):
+        logs_bundle = bundles_by_name["logs.txt"]
 
         assert "install" in logs_bundle.content
         assert "npm ci" in logs_bundle.content
         assert "added 200 packages" in logs_bundle.content
         assert "Tests: 42 passed" in logs_bundle.content
 
-    def test_logs_contain_stderr(self, sample_result):
-        bundles = bundle_artifacts("run-123", "repo-456", sample_result)
-        logs_bundle = next(b for b in bundles if b.filename == "logs.txt")
+    def test_logs_contain_stderr(self, bundles_by_name):
+        logs_bundle = bundles_by_name["logs.txt"]
 
         assert "Coverage: 95%" in logs_bundle.content
 
-    def test_trace_json_is_valid(self, sample_result):
-        bundles = bundle_artifacts("run-123", "repo-456", sample_result)
-        trace_bundle = next(b for b in bundles if b.filename == "trace.json")
-        data = json.loads(trace_bundle.content)
-
-        assert data["run_id"] == "run-123"
-        assert data["repo_id"] == "repo-456"
-        assert data["pipeline"]["is_success"] is True
-        assert data["pipeline"]["step_count"] == 3
-        assert len(data["steps"]) == 3
-
-    def test_trace_truncates_long_output(self):
-        result = BaselineResult(
-            steps=[
-                StepResult(
-                    name="test", command="npm test", exit_code=0,
-                    duration_seconds=10.0,
-                    stdout="x" * 1000,
-                ),
-            ],
-            is_success=True,
-        )
-        bundles = bundle_artifacts("run-1", "repo-1", result)
-        trace_bundle = next(b for b in bundles if b.filename == "trace.json")
-        data = json.loads(trace_bundle.content)
+    def test_trace_json_is_valid(self, trace_data):
+        assert trace_data["run_id"] == "run-123"
+        assert trace_data["repo_id"] == "repo-456"
+        assert trace_data["pipeline"]["is_success"] is True
+        assert trace_data["pipeline"]["step_count"] == 3
+        assert len(trace_data["steps"]) == 3
 
+    @pytest.mark.parametrize("preview_key", ["stdout_preview", "stderr_preview"])
+    def test_trace_truncates_long_output(self, long_output_trace_data, preview_key):
         # Trace preview should be truncated to 500 chars
-        assert len(data["steps"][0]["stdout_preview"]) == 500
-
-    def test_artifact_types_are_correct(self, sample_result):
-        bundles = bundle_artifacts("run-123", "repo-456", sample_result)
-        type_map = {b.filename: b.artifact_type for b in bundles}
-        assert type_map["baseline.json"] == "baseline"
-        assert type_map["logs.txt"] == "log"
-        assert type_map["trace.json"] == "trace"
+        assert len(long_output_trace_data["steps"][0][preview_key]) == 500
 
     def test_failed_pipeline_includes_error_in_logs(self):
         result = BaselineResult(
@@ -117,7 +129,7 @@ class TestBundleArtifacts:
             error="Step 'install' failed with exit code 1",
         )
         bundles = bundle_artifacts("run-fail", "repo-1", result)
-        logs_bundle = next(b for b in bundles if b.filename == "logs.txt")
+        logs_bundle = _by_name(bundles)["logs.txt"]
 
         assert "PIPELINE ERROR" in logs_bundle.content
         assert "install" in logs_bundle.content
@@ -127,7 +139,6 @@ class TestBundleArtifacts:
         bundles = bundle_artifacts("run-empty", "repo-1", result)
         assert len(bundles) == 3
 
-        baseline_bundle = next(b for b in bundles if b.filename == "baseline.json")
-        data = json.loads(baseline_bundle.content)
+        data = json.loads(_by_name(bundles)["baseline.json"].content)
         assert data["steps"] == []
         assert data["total_duration_seconds"] == 0.0
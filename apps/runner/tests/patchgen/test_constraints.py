@@ -12,36 +12,39 @@ from runner.patchgen.constraints import (
 from runner.patchgen.types import ConstraintViolation, PatchResult
 
 
+_BASE_PATCH_KWARGS = {
+    "diff": "--- a\n+++ b\n@@ -1 +1 @@\n-old\n+new\n",
+    "explanation": "test",
+    "template_name": "test",
+    "lines_changed": 2,
+}
+
+# Boundary-sized diffs for the line-count tests, built once at import.
+_DIFF_200 = "-old\n" * 100 + "+new\n" * 100
+_DIFF_202 = "-old\n" * 101 + "+new\n" * 101
+
+
 def _make_patch(**kwargs) -> PatchResult:
-    defaults = {
-        "diff": "--- a\n+++ b\n@@ -1 +1 @@\n-old\n+new\n",
-        "explanation": "test",
-        "touched_files": ["src/utils.ts"],
-        "template_name": "test",
-        "lines_changed": 2,
-    }
+    defaults = {**_BASE_PATCH_KWARGS, "touched_files": ["src/utils.ts"]}
     defaults.update(kwargs)
     return PatchResult(**defaults)
 
 
 class TestFileCountConstraint:
-    def test_one_file_passes(self):
-        patch = _make_patch(touched_files=["src/a.ts"])
-        enforce_constraints(patch)  # Should not raise
-
-    def test_five_files_passes(self):
-        patch = _make_patch(touched_files=[f"src/file{i}.ts" for i in range(5)])
-        enforce_constraints(patch)
-
-    def test_six_files_raises(self):
-        patch = _make_patch(touched_files=[f"src/file{i}.ts" for i in range(6)])
-        with pytest.raises(ConstraintViolation) as exc:
-            enforce_constraints(patch)
-        assert exc.value.constraint == "max_files"
-
-    def test_zero_files_passes(self):
-        patch = _make_patch(touched_files=[])
-        enforce_constraints(patch)
+    @pytest.mark.parametrize("n_files, expect_raises", [
+        (0, False),
+        (1, False),
+        (MAX_FILES, False),
+        (MAX_FILES + 1, True),
+    ])
+    def test_file_count_bound(self, n_files, expect_raises):
+        patch = _make_patch(touched_files=[f"src/file{i}.ts" for i in range(n_files)])
+        if expect_raises:
+            with pytest.raises(ConstraintViolation) as exc:
+                enforce_constraints(patch)
+            assert exc.value.constraint == "max_files"
+        else:
+            enforce_constraints(patch)  # Should not raise
 
 
 class TestLineCountConstraint:
@@ -51,13 +54,11 @@ class TestLineCountConstraint:
         enforce_constraints(patch)
 
     def test_exactly_200_passes(self):
-        diff = "-old\n" * 100 + "+new\n" * 100
-        patch = _make_patch(diff=diff, lines_changed=200)
+        patch = _make_patch(diff=_DIFF_200, lines_changed=200)
         enforce_constraints(patch)
 
     def test_201_lines_raises(self):
-        diff = "-old\n" * 101 + "+new\n" * 101
-        patch = _make_patch(diff=diff, lines_changed=202)
+        patch = _make_patch(diff=_DIFF_202, lines_changed=202)
         with pytest.raises(ConstraintViolation) as exc:
             enforce_constraints(patch)
         assert exc.value.constraint == "max_lines"
@@ -82,7 +83,7 @@ class TestForbiddenFileConstraint:
         "test/integration.ts",
     ])
     def test_forbidden_file_raises(self, path):
-        patch = _make_patch(touched_files=[path])
+        patch = PatchResult(**_BASE_PATCH_KWARGS, touched_files=[path])
         with pytest.raises(ConstraintViolation) as exc:
             enforce_constraints(patch)
         assert exc.value.constraint == "forbidden_file"
@@ -94,7 +95,7 @@ class TestForbiddenFileConstraint:
         "app/api/route.ts",
     ])
     def test_allowed_file_passes(self, path):
-        patch = _make_patch(touched_files=[path])
+        patch = PatchResult(**_BASE_PATCH_KWARGS, touched_files=[path])
         enforce_constraints(patch)
 
 
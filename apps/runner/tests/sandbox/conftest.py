@@ -0,0 +1,50 @@
+"""Shared fixtures for the sandbox tests.
+
+The mocked ``resource`` module is built once per session and reset between
+tests. DNS is stubbed for every test so nothing in this package reaches the
+network; tests that care about the resolved address override it with
+``monkeypatch.setattr(socket, "getaddrinfo", mock_getaddrinfo(ip))``.
+"""
+
+import socket
+import sys
+from unittest.mock import MagicMock
+
+import pytest
+
+# A public address (github.com) so validate_repo_url() passes by default.
+_DEFAULT_PUBLIC_IP = "140.82.112.3"
+
+
+@pytest.fixture(scope="session")
+def _resource_mock() -> MagicMock:
+    mock_resource = MagicMock()
+    mock_resource.RLIMIT_AS = 5  # arbitrary sentinel
+    mock_resource.RLIMIT_CPU = 0
+    mock_resource.RLIM_INFINITY = -1
+    return mock_resource
+
+
+@pytest.fixture
+def linux_resource(monkeypatch, _resource_mock: MagicMock) -> MagicMock:
+    """Install the mocked ``resource`` module and pretend to run on Linux."""
+    _resource_mock.reset_mock(return_value=True, side_effect=True)
+    monkeypatch.setitem(sys.modules, "resource", _resource_mock)
+    monkeypatch.setattr(sys, "platform", "linux")
+    return _resource_mock
+
+
+def _mock_getaddrinfo(ip: str):
+    """Return a mock getaddrinfo that resolves to the given IP."""
+    return lambda host, port: [(socket.AF_INET, socket.SOCK_STREAM, 6, "", (ip, 0))]
+
+
+@pytest.fixture(scope="session")
+def mock_getaddrinfo():
+    """The getaddrinfo stub factory, for tests that resolve to a specific IP."""
+    return _mock_getaddrinfo
+
+
+@pytest.fixture(autouse=True)
+def _offline_dns(monkeypatch) -> None:
+    monkeypatch.setattr(socket, "getaddrinfo", _mock_getaddrinfo(_DEFAULT_PUBLIC_IP))
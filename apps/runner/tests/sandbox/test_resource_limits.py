@@ -5,35 +5,61 @@ macOS where the behaviour of setrlimit differs from Linux).
 """
 
 import sys
-from unittest.mock import MagicMock, call, patch
+from unittest.mock import MagicMock
 
 import pytest
 
 from runner.sandbox.limits import apply_resource_limits
 
+_GB = 1024 * 1024 * 1024
 
-class TestApplyResourceLimits:
-    def test_sets_memory_limit(self) -> None:
-        """Default profile RLIMIT_AS must be set to 4 GB.
-
-        512 MB was too low — Node.js / V8 maps several GB of virtual address
-        space at startup, causing SIGTRAP (exit 133) before npm can run.
-        """
-        mock_resource = MagicMock()
-        mock_resource.RLIMIT_AS = 5  # arbitrary sentinel
-        mock_resource.RLIMIT_CPU = 0
-        mock_resource.RLIM_INFINITY = -1
-
-        with patch.dict("sys.modules", {"resource": mock_resource}):
-            with patch("sys.platform", "linux"):
-                apply_resource_limits()
 
-        mock_resource.setrlimit.assert_any_call(
-            mock_resource.RLIMIT_AS,
-            (4 * 1024 * 1024 * 1024, mock_resource.RLIM_INFINITY),
+class TestApplyResourceLimits:
+    # The default profile used to cap at 512 MB, which was too low: Node.js /
+    # V8 maps several GB of virtual address space at startup, causing SIGTRAP
+    # (exit 133) before npm could run.
+    @pytest.mark.parametrize("env, expected_gb", [
+        pytest.param({}, 4, id="default"),
+        pytest.param({"EVOBASE_RESOURCE_PROFILE": "jvm"}, 12, id="jvm"),
+        pytest.param({"EVOBASE_RESOURCE_PROFILE": "native"}, 16, id="native"),
+        pytest.param(
+            {"EVOBASE_RLIMIT_AS_BYTES": str(8 * _GB)},
+            8, id="default-env-override",
+        ),
+        pytest.param(
+            {
+                "EVOBASE_RESOURCE_PROFILE": "python",
+                "EVOBASE_RLIMIT_AS_BYTES_PYTHON": str(8 * _GB),
+            },
+            8, id="python-env-override",
+        ),
+        pytest.param(
+            {
+                "EVOBASE_RESOURCE_PROFILE": "jvm",
+                "EVOBASE_RLIMIT_AS_BYTES_JVM": str(10 * _GB),
+            },
+            10, id="jvm-env-override",
+        ),
+        pytest.param(
+            {
+                "EVOBASE_RESOURCE_PROFILE": "native",
+                "EVOBASE_RLIMIT_AS_BYTES_NATIVE": str(14 * _GB),
+            },
+            14, id="native-env-override",
+        ),
+    ])
+    def test_sets_memory_limit(self, linux_resource, monkeypatch, env, expected_gb) -> None:
+        """RLIMIT_AS follows the resource profile default or its env override."""
+        for key, value in env.items():
+            monkeypatch.setenv(key, value)
+        apply_resource_limits()
+
+        linux_resource.setrlimit.assert_any_call(
+            linux_resource.RLIMIT_AS,
+            (expected_gb * _GB, linux_resource.RLIM_INFINITY),
         )
 
-    def test_js_profile_skips_rlimit_as(self) -> None:
+    def test_js_profile_skips_rlimit_as(self, linux_resource, monkeypatch) -> None:
         """JS profile disables RLIMIT_AS to avoid blocking Wasm virtual mappings.
 
         WebAssembly (Turbopack/SWC/Vitest) requires large contiguous virtual
@@ -42,240 +68,76 @@ class TestApplyResourceLimits:
         virtual address space unlimited and bounds memory via NODE_OPTIONS
         instead.
         """
-        mock_resource = MagicMock()
-        mock_resource.RLIMIT_AS = 5
-        mock_resource.RLIMIT_CPU = 0
-        mock_resource.RLIM_INFINITY = -1
-
-        with patch.dict("sys.modules", {"resource": mock_resource}):
-            with patch("sys.platform", "linux"):
-                with patch.dict("os.environ", {"EVOBASE_RESOURCE_PROFILE": "js"}, clear=False):
-                    apply_resource_limits()
+        monkeypatch.setenv("EVOBASE_RESOURCE_PROFILE", "js")
+        apply_resource_limits()
 
         # RLIMIT_AS must NOT be set for the JS profile.
-        for call_args in mock_resource.setrlimit.call_args_list:
-            assert call_args[0][0] != mock_resource.RLIMIT_AS, (
+        for call_args in linux_resource.setrlimit.call_args_list:
+            assert call_args[0][0] != linux_resource.RLIMIT_AS, (
                 "RLIMIT_AS should not be set for the JS resource profile"
             )
 
-    def test_python_profile_skips_rlimit_as(self) -> None:
+    def test_python_profile_skips_rlimit_as(self, linux_resource, monkeypatch) -> None:
         """Python profile disables RLIMIT_AS.
 
         uv and other Python package managers are Rust/C binaries that mmap
         large blocks for parallel downloads. A 4 GB virtual-address-space cap
         causes spurious allocation failures even on machines with plenty of RAM.
         """
-        mock_resource = MagicMock()
-        mock_resource.RLIMIT_AS = 5
-        mock_resource.RLIMIT_CPU = 0
-        mock_resource.RLIM_INFINITY = -1
+        monkeypatch.setenv("EVOBASE_RESOURCE_PROFILE", "python")
+        apply_resource_limits()
 
-        with patch.dict("sys.modules", {"resource": mock_resource}):
-            with patch("sys.platform", "linux"):
-                with patch.dict("os.environ", {"EVOBASE_RESOURCE_PROFILE": "python"}, clear=False):
-                    apply_resource_limits()
-
-        for call_args in mock_resource.setrlimit.call_args_list:
-            assert call_args[0][0] != mock_resource.RLIMIT_AS, (
+        for call_args in linux_resource.setrlimit.call_args_list:
+            assert call_args[0][0] != linux_resource.RLIMIT_AS, (
                 "RLIMIT_AS should not be set for the python resource profile"
             )
 
-    def test_python_memory_limit_can_be_overridden_by_env(self) -> None:
-        """Python profile honors python-specific memory override env."""
-        mock_resource = MagicMock()
-        mock_resource.RLIMIT_AS = 5
-        mock_resource.RLIMIT_CPU = 0
-        mock_resource.RLIM_INFINITY = -1
-
-        with patch.dict("sys.modules", {"resource": mock_resource}):
-            with patch("sys.platform", "linux"):
-                with patch.dict(
-                    "os.environ",
-                    {
-                        "EVOBASE_RESOURCE_PROFILE": "python",
-                        "EVOBASE_RLIMIT_AS_BYTES_PYTHON": str(8 * 1024 * 1024 * 1024),
-                    },
-                    clear=False,
-                ):
-                    apply_resource_limits()
-
-        mock_resource.setrlimit.assert_any_call(
-            mock_resource.RLIMIT_AS,
-            (8 * 1024 * 1024 * 1024, mock_resource.RLIM_INFINITY),
-        )
-
-    def test_sets_jvm_memory_limit_when_profile_is_jvm(self) -> None:
-        """JVM profile uses a higher RLIMIT_AS default (12 GB)."""
-        mock_resource = MagicMock()
-        mock_resource.RLIMIT_AS = 5
-        mock_resource.RLIMIT_CPU = 0
-        mock_resource.RLIM_INFINITY = -1
-
-        with patch.dict("sys.modules", {"resource": mock_resource}):
-            with patch("sys.platform", "linux"):
-                with patch.dict("os.environ", {"EVOBASE_RESOURCE_PROFILE": "jvm"}, clear=False):
-                    apply_resource_limits()
-
-        mock_resource.setrlimit.assert_any_call(
-            mock_resource.RLIMIT_AS,
-            (12 * 1024 * 1024 * 1024, mock_resource.RLIM_INFINITY),
-        )
-
-    def test_sets_native_memory_limit_when_profile_is_native(self) -> None:
-        """Native profile uses a higher RLIMIT_AS default (16 GB)."""
-        mock_resource = MagicMock()
-        mock_resource.RLIMIT_AS = 5
-        mock_resource.RLIMIT_CPU = 0
-        mock_resource.RLIM_INFINITY = -1
-
-        with patch.dict("sys.modules", {"resource": mock_resource}):
-            with patch("sys.platform", "linux"):
-                with patch.dict("os.environ", {"EVOBASE_RESOURCE_PROFILE": "native"}, clear=False):
-                    apply_resource_limits()
-
-        mock_resource.setrlimit.assert_any_call(
-            mock_resource.RLIMIT_AS,
-            (16 * 1024 * 1024 * 1024, mock_resource.RLIM_INFINITY),
-        )
-
-    def test_memory_limit_can_be_overridden_by_env(self) -> None:
-        """RLIMIT_AS uses explicit env override when set."""
-        mock_resource = MagicMock()
-        mock_resource.RLIMIT_AS = 5
-        mock_resource.RLIMIT_CPU = 0
-        mock_resource.RLIM_INFINITY = -1
-
-        with patch.dict("sys.modules", {"resource": mock_resource}):
-            with patch("sys.platform", "linux"):
-                with patch.dict("os.environ", {"EVOBASE_RLIMIT_AS_BYTES": str(8 * 1024 * 1024 * 1024)}, clear=False):
-                    apply_resource_limits()
-
-        mock_resource.setrlimit.assert_any_call(
-            mock_resource.RLIMIT_AS,
-            (8 * 1024 * 1024 * 1024, mock_resource.RLIM_INFINITY),
-        )
-
-    def test_jvm_memory_limit_can_be_overridden_by_env(self) -> None:
-        """JVM profile honors JVM-specific memory override env."""
-        mock_resource = MagicMock()
-        mock_resource.RLIMIT_AS = 5
-        mock_resource.RLIMIT_CPU = 0
-        mock_resource.RLIM_INFINITY = -1
-
-        with patch.dict("sys.modules", {"resource": mock_resource}):
-            with patch("sys.platform", "linux"):
-                with patch.dict(
-                    "os.environ",
-                    {
-                        "EVOBASE_RESOURCE_PROFILE": "jvm",
-                        "EVOBASE_RLIMIT_AS_BYTES_JVM": str(10 * 1024 * 1024 * 1024),
-                    },
-                    clear=False,
-                ):
-                    apply_resource_limits()
-
-        mock_resource.setrlimit.assert_any_call(
-            mock_resource.RLIMIT_AS,
-            (10 * 1024 * 1024 * 1024, mock_resource.RLIM_INFINITY),
-        )
-
-    def test_native_memory_limit_can_be_overridden_by_env(self) -> None:
-        """Native profile honors native-specific memory override env."""
-        mock_resource = MagicMock()
-        mock_resource.RLIMIT_AS = 5
-        mock_resource.RLIMIT_CPU = 0
-        mock_resource.RLIM_INFINITY = -1
-
-        with patch.dict("sys.modules", {"resource": mock_resource}):
-            with patch("sys.platform", "linux"):
-                with patch.dict(
-                    "os.environ",
-                    {
-                        "EVOBASE_RESOURCE_PROFILE": "native",
-                        "EVOBASE_RLIMIT_AS_BYTES_NATIVE": str(14 * 1024 * 1024 * 1024),
-                    },
-                    clear=False,
-                ):
-                    apply_resource_limits()
-
-        mock_resource.setrlimit.assert_any_call(
-            mock_resource.RLIMIT_AS,
-            (14 * 1024 * 1024 * 1024, mock_resource.RLIM_INFINITY),
-        )
-
-    def test_memory_limit_can_be_disabled_with_zero_override(self) -> None:
+    def test_memory_limit_can_be_disabled_with_zero_override(self, linux_resource, monkeypatch) -> None:
         """Setting EVOBASE_RLIMIT_AS_BYTES=0 disables RLIMIT_AS."""
-        mock_resource = MagicMock()
-        mock_resource.RLIMIT_AS = 5
-        mock_resource.RLIMIT_CPU = 0
-        mock_resource.RLIM_INFINITY = -1
-
-        with patch.dict("sys.modules", {"resource": mock_resource}):
-            with patch("sys.platform", "linux"):
-                with patch.dict("os.environ", {"EVOBASE_RLIMIT_AS_BYTES": "0"}, clear=False):
-                    apply_resource_limits()
+        monkeypatch.setenv("EVOBASE_RLIMIT_AS_BYTES", "0")
+        apply_resource_limits()
 
         as_calls = [
-            c for c in mock_resource.setrlimit.call_args_list
-            if c.args and c.args[0] == mock_resource.RLIMIT_AS
+            c for c in linux_resource.setrlimit.call_args_list
+            if c.args and c.args[0] == linux_resource.RLIMIT_AS
         ]
         assert not as_calls
-        mock_resource.setrlimit.assert_any_call(
-            mock_resource.RLIMIT_CPU,
-            (300, mock_resource.RLIM_INFINITY),
+        linux_resource.setrlimit.assert_any_call(
+            linux_resource.RLIMIT_CPU,
+            (300, linux_resource.RLIM_INFINITY),
         )
 
-    def test_sets_cpu_limit(self) -> None:
+    def test_sets_cpu_limit(self, linux_resource) -> None:
         """RLIMIT_CPU must be set to 300 seconds (matches wall-clock timeout)."""
-        mock_resource = MagicMock()
-        mock_resource.RLIMIT_AS = 5
-        mock_resource.RLIMIT_CPU = 0
-        mock_resource.RLIM_INFINITY = -1
-
-        with patch.dict("sys.modules", {"resource": mock_resource}):
-            with patch("sys.platform", "linux"):
-                apply_resource_limits()
+        apply_resource_limits()
 
-        mock_resource.setrlimit.assert_any_call(
-            mock_resource.RLIMIT_CPU,
-            (300, mock_resource.RLIM_INFINITY),
+        linux_resource.setrlimit.assert_any_call(
+            linux_resource.RLIMIT_CPU,
+            (300, linux_resource.RLIM_INFINITY),
         )
 
-    def test_cpu_limit_can_be_overridden_by_env(self) -> None:
-        mock_resource = MagicMock()
-        mock_resource.RLIMIT_AS = 5
-        mock_resource.RLIMIT_CPU = 0
-        mock_resource.RLIM_INFINITY = -1
+    def test_cpu_limit_can_be_overridden_by_env(self, linux_resource, monkeypatch) -> None:
+        monkeypatch.setenv("EVOBASE_RLIMIT_CPU_SECONDS", "450")
+        apply_resource_limits()
 
-        with patch.dict("sys.modules", {"resource": mock_resource}):
-            with patch("sys.platform", "linux"):
-                with patch.dict("os.environ", {"EVOBASE_RLIMIT_CPU_SECONDS": "450"}, clear=False):
-                    apply_resource_limits()
-
-        mock_resource.setrlimit.assert_any_call(
-            mock_resource.RLIMIT_CPU,
-            (450, mock_resource.RLIM_INFINITY),
+        linux_resource.setrlimit.assert_any_call(
+            linux_resource.RLIMIT_CPU,
+            (450, linux_resource.RLIM_INFINITY),
         )
 
-    def test_no_op_on_windows(self) -> None:
+    def test_no_op_on_windows(self, monkeypatch) -> None:
         """No rlimits should be set when running on Windows."""
         mock_resource = MagicMock()
+        monkeypatch.setitem(sys.modules, "resource", mock_resource)
+        monkeypatch.setattr(sys, "platform", "win32")
 
-        with patch.dict("sys.modules", {"resource": mock_resource}):
-            with patch("sys.platform", "win32"):
-                apply_resource_limits()
+        apply_resource_limits()
 
         mock_resource.setrlimit.assert_not_called()
 
-    def test_does_not_raise_when_setrlimit_fails(self) -> None:
+    def test_does_not_raise_when_setrlimit_fails(self, linux_resource) -> None:
         """A failing setrlimit (e.g., on hardened hosts) must not crash the worker."""
-        mock_resource = MagicMock()
-        mock_resource.RLIMIT_AS = 5
-        mock_resource.RLIMIT_CPU = 0
-        mock_resource.RLIM_INFINITY = -1
-        mock_resource.setrlimit.side_effect = OSError("permission denied")
+        linux_resource.setrlimit.side_effect = OSError("permission denied")
 
-        with patch.dict("sys.modules", {"resource": mock_resource}):
-            with patch("sys.platform", "linux"):
-                # Must not raise
-                apply_resource_limits()
+        # Must not raise
+        apply_resource_limits()
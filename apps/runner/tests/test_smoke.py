@@ -1,10 +1,12 @@
+import importlib
+import pkgutil
+
+
 def test_runner_imports():
     """Verify all runner submodules can be imported without errors."""
     import runner
-    import runner.detector
-    import runner.patchgen
-    import runner.validator
-    import runner.packaging
-    import runner.sandbox
+
+    for module_info in pkgutil.walk_packages(runner.__path__, prefix="runner."):
+        importlib.import_module(module_info.name)
 
     assert runner is not None
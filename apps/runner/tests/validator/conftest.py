@@ -0,0 +1,76 @@
+"""Shared fixtures for the validator tests.
+
+The npm DetectionResult and the single-file PatchResult are built once per
+session. Nothing under runner.validator mutates either, so tests derive
+variants with ``dataclasses.replace()`` rather than building from scratch.
+"""
+
+import subprocess
+from unittest.mock import MagicMock
+
+import pytest
+
+from runner.detector.types import DetectionResult
+from runner.patchgen.types import PatchResult
+from runner.validator.types import StepResult
+
+
+@pytest.fixture(scope="session")
+def base_config() -> DetectionResult:
+    """npm project with install and test commands only."""
+    return DetectionResult(
+        package_manager="npm",
+        install_cmd="npm ci",
+        test_cmd="npm test",
+    )
+
+
+@pytest.fixture(scope="session")
+def base_patch() -> PatchResult:
+    """One-line patch touching a single TypeScript file."""
+    return PatchResult(
+        diff="--- a/f\n+++ b/f\n@@ -1 +1 @@\n-old\n+new\n",
+        explanation="test patch",
+        touched_files=["src/f.ts"],
+        template_name="set_membership",
+        lines_changed=2,
+    )
+
+
+@pytest.fixture(scope="session")
+def step_factory():
+    """Build a StepResult from passing defaults, overriding only what a test checks."""
+    def _make(**overrides) -> StepResult:
+        fields = {"name": "test", "command": "npm test", "exit_code": 0, "duration_seconds": 1.0}
+        return StepResult(**{**fields, **overrides})
+
+    return _make
+
+
+@pytest.fixture(scope="session")
+def repo_dir(tmp_path_factory):
+    """Empty repo root shared by tests that never write into it.
+
+    Subprocess, run_step and patch apply/revert are mocked in those tests, so
+    the directory is only passed through as a cwd. Tests that create files
+    (e.g. package.json) must keep using ``tmp_path``.
+    """
+    return tmp_path_factory.mktemp("repo")
+
+
+@pytest.fixture(scope="session")
+def completed_ok() -> subprocess.CompletedProcess:
+    """Clean exit with no output; callers only read it."""
+    return subprocess.CompletedProcess(args=(), returncode=0, stdout="", stderr="")
+
+
+@pytest.fixture
+def mock_run(monkeypatch, completed_ok) -> MagicMock:
+    """Stub subprocess.run for the executor and patch applicator.
+
+    Both modules call it through the shared ``subprocess`` module, so one
+    patch covers them. Defaults to ``completed_ok``.
+    """
+    mock = MagicMock(return_value=completed_ok)
+    monkeypatch.setattr(subprocess, "run", mock)
+    return mock
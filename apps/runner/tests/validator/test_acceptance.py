@@ -24,6 +24,15 @@ def _make_step(name: str, exit_code: int = 0) -> StepResult:
     )
 
 
+# Steps are read-only value objects here, so each (name, exit_code) pair is
+# built once at import and shared by every candidate.
+_STEPS = {
+    (name, exit_code): _make_step(name, exit_code)
+    for name in ("build", "test", "typecheck")
+    for exit_code in (0, 1)
+}
+
+
 def _make_baseline(
     has_bench: bool = False,
     bench_duration: float = 1.0,
@@ -45,41 +54,48 @@ def _make_candidate(
 ) -> BaselineResult:
     r = BaselineResult()
     if has_build:
-        r.steps.append(_make_step("build", exit_code=0 if build_passes else 1))
-    r.steps.append(_make_step("test", exit_code=0 if test_passes else 1))
+        r.steps.append(_STEPS["build", 0 if build_passes else 1])
+    r.steps.append(_STEPS["test", 0 if test_passes else 1])
     if has_typecheck:
-        r.steps.append(_make_step("typecheck", exit_code=0 if typecheck_passes else 1))
+        r.steps.append(_STEPS["typecheck", 0 if typecheck_passes else 1])
     if has_bench:
         r.bench_result = {"command": "bench", "duration_seconds": bench_duration, "stdout": ""}
     r.is_success = test_passes
     return r
 
 
+# evaluate_acceptance() and compare_benchmarks() only read their inputs, so
+# the plain, unmodified combinations are built once and shared.
+_DEFAULT_BASELINE = _make_baseline()
+_PASSING_CANDIDATE = _make_candidate(test_passes=True)
+_FAILING_CANDIDATE = _make_candidate(test_passes=False)
+
+
 class TestTestGate:
     def test_tests_pass_accepts(self):
-        candidate = _make_candidate(test_passes=True)
-        baseline = _make_baseline()
+        candidate = _PASSING_CANDIDATE
+        baseline = _DEFAULT_BASELINE
         verdict = evaluate_acceptance(candidate, baseline)
         assert verdict.is_accepted is True
         assert "test_gate" in verdict.gates_passed
 
     def test_tests_fail_rejects(self):
-        candidate = _make_candidate(test_passes=False)
-        baseline = _make_baseline()
+        candidate = _FAILING_CANDIDATE
+        baseline = _DEFAULT_BASELINE
         verdict = evaluate_acceptance(candidate, baseline)
         assert verdict.is_accepted is False
         assert "test_gate" in verdict.gates_failed
 
     def test_no_test_step_rejects(self):
         candidate = BaselineResult()  # No steps at all
-        baseline = _make_baseline()
+        baseline = _DEFAULT_BASELINE
         verdict = evaluate_acceptance(candidate, baseline)
         assert verdict.is_accepted is False
         assert "test_gate" in verdict.gates_failed
 
     def test_rejection_reason_mentions_tests(self):
-        candidate = _make_candidate(test_passes=False)
-        baseline = _make_baseline()
+        candidate = _FAILING_CANDIDATE
+        baseline = _DEFAULT_BASELINE
         verdict = evaluate_acceptance(candidate, baseline)
         assert "test" in verdict.reason.lower() or "Test" in verdict.reason
 
@@ -87,28 +103,28 @@ class TestTestGate:
 class TestBuildGate:
     def test_build_pass_accepts(self):
         candidate = _make_candidate(has_build=True, build_passes=True)
-        baseline = _make_baseline()
+        baseline = _DEFAULT_BASELINE
         verdict = evaluate_acceptance(candidate, baseline)
         assert verdict.is_accepted is True
         assert "build_gate" in verdict.gates_passed
 
     def test_build_fail_rejects(self):
         candidate = _make_candidate(has_build=True, build_passes=False)
-        baseline = _make_baseline()
+        baseline = _DEFAULT_BASELINE
         verdict = evaluate_acceptance(candidate, baseline)
         assert verdict.is_accepted is False
         assert "build_gate" in verdict.gates_failed
 
     def test_build_fail_reason_mentions_build(self):
         candidate = _make_candidate(has_build=True, build_passes=False)
-        baseline = _make_baseline()
+        baseline = _DEFAULT_BASELINE
         verdict = evaluate_acceptance(candidate, baseline)
         assert "build" in verdict.reason.lower()
 
     def test_build_fail_overrides_passing_tests(self):
         """Tests passing is not enough — a broken build must be rejected."""
         candidate = _make_candidate(has_build=True, build_passes=False, test_passes=True)
-        baseline = _make_baseline()
+        baseline = _DEFAULT_BASELINE
         verdict = evaluate_acceptance(candidate, baseline)
         assert verdict.is_accepted is False
         assert "test_gate" in verdict.gates_passed
@@ -116,8 +132,8 @@ class TestBuildGate:
 
     def test_no_build_step_skips_gate(self):
         """When no build_cmd was configured, the build gate is simply absent."""
-        candidate = _make_candidate(has_build=False)
-        baseline = _make_baseline()
+        candidate = _PASSING_CANDIDATE
+        baseline = _DEFAULT_BASELINE
         verdict = evaluate_acceptance(candidate, baseline)
         assert verdict.is_accepted is True
         assert "build_gate" not in verdict.gates_passed
@@ -127,22 +143,22 @@ class TestBuildGate:
 class TestTypecheckGate:
     def test_typecheck_pass_adds_gate(self):
         candidate = _make_candidate(has_typecheck=True, typecheck_passes=True)
-        baseline = _make_baseline()
+        baseline = _DEFAULT_BASELINE
         verdict = evaluate_acceptance(candidate, baseline)
         assert verdict.is_accepted is True
         assert "typecheck_gate" in verdict.gates_passed
 
     def test_typecheck_fail_downgrades_to_low(self):
         candidate = _make_candidate(has_typecheck=True, typecheck_passes=False)
-        baseline = _make_baseline()
+        baseline = _DEFAULT_BASELINE
         verdict = evaluate_acceptance(candidate, baseline)
         assert verdict.is_accepted is True  # not rejected — still accepted
         assert verdict.confidence == CONFIDENCE_LOW
         assert "typecheck_gate" in verdict.gates_failed
 
     def test_no_typecheck_is_medium_confidence(self):
-        candidate = _make_candidate(has_typecheck=False)
-        baseline = _make_baseline()
+        candidate = _PASSING_CANDIDATE
+        baseline = _DEFAULT_BASELINE
         verdict = evaluate_acceptance(candidate, baseline)
         assert verdict.confidence == CONFIDENCE_MEDIUM
 
@@ -156,29 +172,18 @@ class TestSourceSafetyGate:
     approve code that may not compile.
     """
 
-    def test_ts_touched_without_compile_step_rejects(self):
-        candidate = _make_candidate(test_passes=True)  # test step only
-        baseline = _make_baseline()
-        verdict = evaluate_acceptance(
-            candidate, baseline, touched_files=["src/app.ts"]
-        )
-        assert verdict.is_accepted is False
-        assert "source_safety_gate" in verdict.gates_failed
-
-    def test_tsx_touched_without_compile_step_rejects(self):
-        candidate = _make_candidate(test_passes=True)
-        baseline = _make_baseline()
+    @pytest.mark.parametrize("touched_files", [
+        pytest.param(["src/app.ts"], id="ts"),
+        pytest.param(["src/Component.tsx"], id="tsx"),
+        pytest.param(["src/Component.jsx"], id="jsx"),
+        pytest.param(["src/App.TS"], id="case-insensitive"),
+        pytest.param(["src/app.py", "src/app.tsx"], id="mixed-extensions"),
+    ])
+    def test_js_touched_without_compile_step_rejects(self, touched_files):
+        candidate = _PASSING_CANDIDATE  # test step only
+        baseline = _DEFAULT_BASELINE
         verdict = evaluate_acceptance(
-            candidate, baseline, touched_files=["src/Component.tsx"]
-        )
-        assert verdict.is_accepted is False
-        assert "source_safety_gate" in verdict.gates_failed
-
-    def test_jsx_touched_without_compile_step_rejects(self):
-        candidate = _make_candidate(test_passes=True)
-        baseline = _make_baseline()
-        verdict = evaluate_acceptance(
-            candidate, baseline, touched_files=["src/Component.jsx"]
+            candidate, baseline, touched_files=touched_files
         )
         assert verdict.is_accepted is False
         assert "source_safety_gate" in verdict.gates_failed
@@ -187,7 +192,7 @@ class TestSourceSafetyGate:
         candidate = _make_candidate(
             test_passes=True, has_build=True, build_passes=True
         )
-        baseline = _make_baseline()
+        baseline = _DEFAULT_BASELINE
         verdict = evaluate_acceptance(
             candidate, baseline, touched_files=["src/app.js"]
         )
@@ -198,7 +203,7 @@ class TestSourceSafetyGate:
         candidate = _make_candidate(
             test_passes=True, has_typecheck=True, typecheck_passes=True
         )
-        baseline = _make_baseline()
+        baseline = _DEFAULT_BASELINE
         verdict = evaluate_acceptance(
             candidate, baseline, touched_files=["src/app.ts"]
         )
@@ -215,90 +220,80 @@ class TestSourceSafetyGate:
         candidate = _make_candidate(
             test_passes=True, has_typecheck=True, typecheck_passes=False
         )
-        baseline = _make_baseline()
+        baseline = _DEFAULT_BASELINE
         verdict = evaluate_acceptance(
             candidate, baseline, touched_files=["src/app.ts"]
         )
         assert "source_safety_gate" not in verdict.gates_failed
 
     def test_non_js_files_skip_gate(self):
-        candidate = _make_candidate(test_passes=True)
-        baseline = _make_baseline()
+        candidate = _PASSING_CANDIDATE
+        baseline = _DEFAULT_BASELINE
         verdict = evaluate_acceptance(
             candidate, baseline, touched_files=["src/app.py", "README.md"]
         )
         assert verdict.is_accepted is True
         assert "source_safety_gate" not in verdict.gates_failed
 
-    def test_mixed_extensions_requires_compile_check(self):
-        candidate = _make_candidate(test_passes=True)
-        baseline = _make_baseline()
-        verdict = evaluate_acceptance(
-            candidate, baseline, touched_files=["src/app.py", "src/app.tsx"]
-        )
-        assert verdict.is_accepted is False
-        assert "source_safety_gate" in verdict.gates_failed
-
     def test_missing_touched_files_skips_gate(self):
         """Backward compat: legacy callers without touched_files are not rejected."""
-        candidate = _make_candidate(test_passes=True)
-        baseline = _make_baseline()
+        candidate = _PASSING_CANDIDATE
+        baseline = _DEFAULT_BASELINE
         verdict = evaluate_acceptance(candidate, baseline)  # no touched_files
         assert verdict.is_accepted is True
 
     def test_empty_touched_files_skips_gate(self):
-        candidate = _make_candidate(test_passes=True)
-        baseline = _make_baseline()
+        candidate = _PASSING_CANDIDATE
+        baseline = _DEFAULT_BASELINE
         verdict = evaluate_acceptance(candidate, baseline, touched_files=[])
         assert verdict.is_accepted is True
 
     def test_reject_reason_mentions_compile(self):
-        candidate = _make_candidate(test_passes=True)
-        baseline = _make_baseline()
+        candidate = _PASSING_CANDIDATE
+        baseline = _DEFAULT_BASELINE
         verdict = evaluate_acceptance(
             candidate, baseline, touched_files=["src/app.ts"]
         )
         assert "compile" in verdict.reason.lower() or "build" in verdict.reason.lower()
 
-    def test_case_insensitive_extension_matching(self):
-        candidate = _make_candidate(test_passes=True)
-        baseline = _make_baseline()
-        verdict = evaluate_acceptance(
-            candidate, baseline, touched_files=["src/App.TS"]
-        )
-        assert verdict.is_accepted is False
-        assert "source_safety_gate" in verdict.gates_failed
+
+@pytest.fixture(scope="module")
+def baseline_1s() -> BaselineResult:
+    """Baseline with a 1.0s benchmark, shared by every benchmark test."""
+    return _make_baseline(has_bench=True, bench_duration=1.0)
+
+
+@pytest.fixture(scope="class")
+def ten_pct_verdict(baseline_1s) -> AcceptanceVerdict:
+    """Verdict for a 1.0s baseline vs 0.9s candidate, evaluated once per class."""
+    candidate = _make_candidate(has_bench=True, bench_duration=0.9)
+    return evaluate_acceptance(candidate, baseline_1s)
 
 
 class TestBenchmarkGate:
-    def test_large_improvement_gives_high_confidence(self):
-        candidate = _make_candidate(has_bench=True, bench_duration=0.9)
-        baseline = _make_baseline(has_bench=True, bench_duration=1.0)
-        verdict = evaluate_acceptance(candidate, baseline)
+    def test_large_improvement_gives_high_confidence(self, ten_pct_verdict):
+        verdict = ten_pct_verdict
         assert verdict.is_accepted is True
         assert verdict.confidence == CONFIDENCE_HIGH
         assert "benchmark_gate" in verdict.gates_passed
 
-    def test_regression_rejects(self):
+    def test_regression_rejects(self, baseline_1s):
         candidate = _make_candidate(has_bench=True, bench_duration=1.2)
-        baseline = _make_baseline(has_bench=True, bench_duration=1.0)
-        verdict = evaluate_acceptance(candidate, baseline)
+        verdict = evaluate_acceptance(candidate, baseline_1s)
         assert verdict.is_accepted is False
         assert "benchmark_gate" in verdict.gates_failed
         assert "regression" in verdict.reason.lower() or "slower" in verdict.reason.lower()
 
-    def test_small_improvement_below_threshold_gives_medium(self):
+    def test_small_improvement_below_threshold_gives_medium(self, baseline_1s):
         # 1% improvement — below 3% threshold
         candidate = _make_candidate(has_bench=True, bench_duration=0.99)
-        baseline = _make_baseline(has_bench=True, bench_duration=1.0)
-        verdict = evaluate_acceptance(candidate, baseline)
+        verdict = evaluate_acceptance(candidate, baseline_1s)
         assert verdict.is_accepted is True
         assert verdict.confidence == CONFIDENCE_MEDIUM  # below threshold, treated as no bench
 
-    def test_exactly_3pct_improvement_gives_high(self):
+    def test_exactly_3pct_improvement_gives_high(self, baseline_1s):
         candidate = _make_candidate(has_bench=True, bench_duration=0.97)
-        baseline = _make_baseline(has_bench=True, bench_duration=1.0)
-        verdict = evaluate_acceptance(candidate, baseline)
+        verdict = evaluate_acceptance(candidate, baseline_1s)
         assert verdict.confidence == CONFIDENCE_HIGH
 
     def test_no_baseline_bench_gives_medium(self):
@@ -307,28 +302,29 @@ class TestBenchmarkGate:
         verdict = evaluate_acceptance(candidate, baseline)
         assert verdict.confidence == CONFIDENCE_MEDIUM
 
-    def test_benchmark_comparison_included_in_verdict(self):
-        candidate = _make_candidate(has_bench=True, bench_duration=0.9)
-        baseline = _make_baseline(has_bench=True, bench_duration=1.0)
-        verdict = evaluate_acceptance(candidate, baseline)
-        assert verdict.benchmark_comparison is not None
-        assert verdict.benchmark_comparison.improvement_pct > 0
+    def test_benchmark_comparison_included_in_verdict(self, ten_pct_verdict):
+        assert ten_pct_verdict.benchmark_comparison is not None
+        assert ten_pct_verdict.benchmark_comparison.improvement_pct > 0
+
+
+@pytest.fixture(scope="module")
+def ten_pct_comparison(baseline_1s) -> BenchmarkComparison:
+    """Comparison for a 1.0s baseline vs 0.9s candidate, computed once."""
+    candidate = _make_candidate(has_bench=True, bench_duration=0.9)
+    return compare_benchmarks(baseline_1s, candidate)
 
 
 class TestCompareBenchmarks:
-    def test_computes_improvement(self):
-        baseline = _make_baseline(has_bench=True, bench_duration=1.0)
-        candidate = _make_candidate(has_bench=True, bench_duration=0.9)
-        cmp = compare_benchmarks(baseline, candidate)
+    def test_computes_improvement(self, ten_pct_comparison):
+        cmp = ten_pct_comparison
         assert cmp is not None
         assert abs(cmp.improvement_pct - 10.0) < 0.01
         assert cmp.passes_threshold is True
         assert cmp.is_significant is True
 
-    def test_regression_negative_improvement(self):
-        baseline = _make_baseline(has_bench=True, bench_duration=1.0)
+    def test_regression_negative_improvement(self, baseline_1s):
         candidate = _make_candidate(has_bench=True, bench_duration=1.1)
-        cmp = compare_benchmarks(baseline, candidate)
+        cmp = compare_benchmarks(baseline_1s, candidate)
         assert cmp is not None
         assert cmp.improvement_pct < 0
         assert cmp.passes_threshold is False
@@ -343,27 +339,24 @@ class TestCompareBenchmarks:
         candidate = _make_candidate(has_bench=False)
         assert compare_benchmarks(baseline, candidate) is None
 
-    def test_to_dict_contains_all_fields(self):
-        baseline = _make_baseline(has_bench=True, bench_duration=1.0)
-        candidate = _make_candidate(has_bench=True, bench_duration=0.9)
-        cmp = compare_benchmarks(baseline, candidate)
-        d = cmp.to_dict()
-        assert all(k in d for k in [
+    def test_to_dict_contains_all_fields(self, ten_pct_comparison):
+        d = ten_pct_comparison.to_dict()
+        assert d.keys() >= {
             "baseline_duration_seconds",
             "candidate_duration_seconds",
             "improvement_pct",
             "is_significant",
             "passes_threshold",
-        ])
+        }
 
 
 class TestAcceptanceVerdictSerialization:
     def test_to_dict_contains_all_fields(self):
-        candidate = _make_candidate(test_passes=True)
-        baseline = _make_baseline()
+        candidate = _PASSING_CANDIDATE
+        baseline = _DEFAULT_BASELINE
         verdict = evaluate_acceptance(candidate, baseline)
         d = verdict.to_dict()
-        assert all(k in d for k in [
+        assert d.keys() >= {
             "is_accepted", "confidence", "reason",
             "gates_passed", "gates_failed", "benchmark_comparison",
-        ])
+        }
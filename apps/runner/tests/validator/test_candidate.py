@@ -8,13 +8,14 @@ Tests cover:
 - Attempt records for full traceability
 """
 
+import functools
+from dataclasses import replace
 from pathlib import Path
-from unittest.mock import MagicMock, call, patch
+from unittest.mock import DEFAULT, patch
 
 import pytest
 
-from runner.detector.types import DetectionResult
-from runner.patchgen.types import PatchResult
+from runner.validator import candidate
 from runner.validator.candidate import run_candidate_validation
 from runner.validator.patch_applicator import PatchApplyError
 from runner.validator.types import (
@@ -25,35 +26,25 @@ from runner.validator.types import (
 )
 
 
-def _make_config(
-    test_cmd: str = "npm test",
-    build_cmd: str = None,
-    typecheck_cmd: str = None,
-    bench_cmd: str = None,
-) -> DetectionResult:
-    return DetectionResult(
-        package_manager="npm",
-        install_cmd="npm ci",
-        test_cmd=test_cmd,
-        build_cmd=build_cmd,
-        typecheck_cmd=typecheck_cmd,
-        bench_cmd=bench_cmd,
-    )
-
-
-def _make_patch(diff: str = "--- a/f\n+++ b/f\n@@ -1 +1 @@\n-old\n+new\n") -> PatchResult:
-    return PatchResult(
-        diff=diff,
-        explanation="test patch",
-        touched_files=["src/f.ts"],
-        template_name="set_membership",
-        lines_changed=2,
-    )
+_ATTEMPT_RECORD_KEYS = frozenset({
+    "attempt_number", "patch_applied",
+    "pipeline_result", "verdict", "error", "timestamp",
+})
 
+_CANDIDATE_RESULT_KEYS = frozenset({"attempts", "final_verdict", "is_accepted"})
 
+# Benchmark payloads are only read by the acceptance gates, so one dict each
+# is shared by every baseline/candidate built below.
+_BENCH_BASELINE = {"command": "bench", "duration_seconds": 1.0, "stdout": ""}
+_BENCH_CANDIDATE = {"command": "bench", "duration_seconds": 0.9, "stdout": ""}
+
+
+# run_candidate_validation() and the acceptance gates only read pipeline and
+# baseline results, so each variant is built once and shared between tests.
+@functools.lru_cache(maxsize=None)
 def _make_passing_pipeline(has_bench: bool = False) -> BaselineResult:
     # Include a passing build step so the source_safety_gate is satisfied
-    # for the default _make_patch() whose touched_files contains "src/f.ts".
+    # for base_patch, whose touched_files contains "src/f.ts".
     r = BaselineResult()
     r.steps = [
         StepResult("build", "npm run build", 0, 0.5, "ok", ""),
@@ -61,10 +52,11 @@ def _make_passing_pipeline(has_bench: bool = False) -> BaselineResult:
     ]
     r.is_success = True
     if has_bench:
-        r.bench_result = {"command": "bench", "duration_seconds": 0.9, "stdout": ""}
+        r.bench_result = _BENCH_CANDIDATE
     return r
 
 
+@functools.lru_cache(maxsize=None)
 def _make_failing_pipeline() -> BaselineResult:
     r = BaselineResult()
     r.steps = [
@@ -75,29 +67,40 @@ def _make_failing_pipeline() -> BaselineResult:
     return r
 
 
+@functools.lru_cache(maxsize=None)
 def _make_baseline(has_bench: bool = False) -> BaselineResult:
     r = BaselineResult(is_success=True)
     if has_bench:
-        r.bench_result = {"command": "bench", "duration_seconds": 1.0, "stdout": ""}
+        r.bench_result = _BENCH_BASELINE
     return r
 
 
+@pytest.fixture(autouse=True)
+def candidate_mocks():
+    """Stub out patch apply/revert and the pipeline run for every test.
+
+    Yields the patch.multiple mapping; tests configure the entries they care
+    about (return_value / side_effect) instead of re-entering patchers.
+    """
+    with patch.multiple(
+        candidate,
+        apply_diff=DEFAULT,
+        revert_diff=DEFAULT,
+        _run_candidate_pipeline=DEFAULT,
+    ) as mocks:
+        yield mocks
+
+
 class TestSuccessfulValidation:
-    def test_accepts_when_tests_pass(self, tmp_path):
-        with (
-            patch("runner.validator.candidate.apply_diff"),
-            patch("runner.validator.candidate.revert_diff"),
-            patch(
-                "runner.validator.candidate._run_candidate_pipeline",
-                return_value=_make_passing_pipeline(),
-            ),
-        ):
-            result = run_candidate_validation(
-                repo_dir=tmp_path,
-                config=_make_config(),
-                patch=_make_patch(),
-                baseline=_make_baseline(),
-            )
+    def test_accepts_when_tests_pass(self, repo_dir, candidate_mocks, base_config, base_patch):
+        candidate_mocks["_run_candidate_pipeline"].return_value = _make_passing_pipeline()
+
+        result = run_candidate_validation(
+            repo_dir=repo_dir,
+            config=base_config,
+            patch=base_patch,
+            baseline=_make_baseline(),
+        )
 
         assert result.is_accepted is True
         assert len(result.attempts) == 1
@@ -105,123 +108,86 @@ class TestSuccessfulValidation:
         assert result.final_verdict is not None
         assert result.final_verdict.confidence == CONFIDENCE_MEDIUM
 
-    def test_high_confidence_with_benchmark(self, tmp_path):
-        with (
-            patch("runner.validator.candidate.apply_diff"),
-            patch("runner.validator.candidate.revert_diff"),
-            patch(
-                "runner.validator.candidate._run_candidate_pipeline",
-                return_value=_make_passing_pipeline(has_bench=True),
-            ),
-        ):
-            result = run_candidate_validation(
-                repo_dir=tmp_path,
-                config=_make_config(bench_cmd="npm run bench"),
-                patch=_make_patch(),
-                baseline=_make_baseline(has_bench=True),
-            )
+    def test_high_confidence_with_benchmark(
+        self, repo_dir, candidate_mocks, base_config, base_patch,
+    ):
+        candidate_mocks["_run_candidate_pipeline"].return_value = (
+            _make_passing_pipeline(has_bench=True)
+        )
+
+        result = run_candidate_validation(
+            repo_dir=repo_dir,
+            config=replace(base_config, bench_cmd="npm run bench"),
+            patch=base_patch,
+            baseline=_make_baseline(has_bench=True),
+        )
 
         assert result.is_accepted is True
         assert result.final_verdict.confidence == CONFIDENCE_HIGH
 
 
 class TestFlakyTestRerun:
-    def test_rerun_on_test_failure(self, tmp_path):
-        """Attempt 1 fails → attempt 2 passes → accepted."""
-        call_count = {"n": 0}
-
-        def mock_pipeline(*args, **kwargs):
-            call_count["n"] += 1
-            if call_count["n"] == 1:
-                return _make_failing_pipeline()
-            return _make_passing_pipeline()
-
-        with (
-            patch("runner.validator.candidate.apply_diff"),
-            patch("runner.validator.candidate.revert_diff"),
-            patch("runner.validator.candidate._run_candidate_pipeline", side_effect=mock_pipeline),
-        ):
-            result = run_candidate_validation(
-                repo_dir=tmp_path,
-                config=_make_config(),
-                patch=_make_patch(),
-                baseline=_make_baseline(),
-            )
-
-        assert len(result.attempts) == 2
-        assert result.attempts[0].verdict.is_accepted is False
-        assert result.attempts[1].verdict.is_accepted is True
-        assert result.is_accepted is True
-
-    def test_rejects_when_both_attempts_fail(self, tmp_path):
-        """Both attempts fail → rejected, 2 attempts recorded."""
-        with (
-            patch("runner.validator.candidate.apply_diff"),
-            patch("runner.validator.candidate.revert_diff"),
-            patch(
-                "runner.validator.candidate._run_candidate_pipeline",
-                return_value=_make_failing_pipeline(),
-            ),
-        ):
-            result = run_candidate_validation(
-                repo_dir=tmp_path,
-                config=_make_config(),
-                patch=_make_patch(),
-                baseline=_make_baseline(),
-            )
-
-        assert len(result.attempts) == 2
-        assert result.is_accepted is False
-
-    def test_no_rerun_when_tests_pass_on_first(self, tmp_path):
-        """Only one attempt when tests pass."""
-        with (
-            patch("runner.validator.candidate.apply_diff"),
-            patch("runner.validator.candidate.revert_diff"),
-            patch(
-                "runner.validator.candidate._run_candidate_pipeline",
-                return_value=_make_passing_pipeline(),
-            ),
-        ):
-            result = run_candidate_validation(
-                repo_dir=tmp_path,
-                config=_make_config(),
-                patch=_make_patch(),
-                baseline=_make_baseline(),
-            )
-
-        assert len(result.attempts) == 1
+    @pytest.mark.parametrize("outcomes, expected_verdicts, expected_accepted", [
+        pytest.param(
+            [_make_failing_pipeline(), _make_passing_pipeline()], [False, True], True,
+            id="fail-then-pass-is-accepted",
+        ),
+        pytest.param(
+            [_make_failing_pipeline(), _make_failing_pipeline()], [False, False], False,
+            id="both-attempts-fail-is-rejected",
+        ),
+        pytest.param(
+            [_make_passing_pipeline()], [True], True,
+            id="no-rerun-when-first-attempt-passes",
+        ),
+    ])
+    def test_rerun_outcomes(
+        self, repo_dir, candidate_mocks, base_config, base_patch,
+        outcomes, expected_verdicts, expected_accepted,
+    ):
+        """A test failure on attempt 1 triggers exactly one rerun."""
+        candidate_mocks["_run_candidate_pipeline"].side_effect = outcomes
+
+        result = run_candidate_validation(
+            repo_dir=repo_dir,
+            config=base_config,
+            patch=base_patch,
+            baseline=_make_baseline(),
+        )
+
+        assert [a.verdict.is_accepted for a in result.attempts] == expected_verdicts
+        assert result.is_accepted is expected_accepted
 
 
 class TestPatchApplyFailure:
-    def test_error_recorded_on_apply_failure(self, tmp_path):
-        with patch(
-            "runner.validator.candidate.apply_diff",
-            side_effect=PatchApplyError("patch failed"),
-        ):
-            result = run_candidate_validation(
-                repo_dir=tmp_path,
-                config=_make_config(),
-                patch=_make_patch(),
-                baseline=_make_baseline(),
-            )
+    def test_error_recorded_on_apply_failure(
+        self, repo_dir, candidate_mocks, base_config, base_patch,
+    ):
+        candidate_mocks["apply_diff"].side_effect = PatchApplyError("patch failed")
+
+        result = run_candidate_validation(
+            repo_dir=repo_dir,
+            config=base_config,
+            patch=base_patch,
+            baseline=_make_baseline(),
+        )
 
         assert result.is_accepted is False
         assert result.attempts[0].patch_applied is False
         assert result.attempts[0].error is not None
         assert "Patch apply error" in result.attempts[0].error
 
-    def test_verdict_is_none_when_apply_fails(self, tmp_path):
-        with patch(
-            "runner.validator.candidate.apply_diff",
-            side_effect=PatchApplyError("patch failed"),
-        ):
-            result = run_candidate_validation(
-                repo_dir=tmp_path,
-                config=_make_config(),
-                patch=_make_patch(),
-                baseline=_make_baseline(),
-            )
+    def test_verdict_is_none_when_apply_fails(
+        self, repo_dir, candidate_mocks, base_config, base_patch,
+    ):
+        candidate_mocks["apply_diff"].side_effect = PatchApplyError("patch failed")
+
+        result = run_candidate_validation(
+            repo_dir=repo_dir,
+            config=base_config,
+            patch=base_patch,
+            baseline=_make_baseline(),
+        )
 
         # No pipeline ran, so no verdict
         assert result.attempts[0].verdict is None
@@ -229,53 +195,43 @@ class TestPatchApplyFailure:
 
 
 class TestPatchAlwaysReverted:
-    def test_revert_called_even_on_test_failure(self, tmp_path):
-        revert_mock = MagicMock()
-
-        with (
-            patch("runner.validator.candidate.apply_diff"),
-            patch("runner.validator.candidate.revert_diff", revert_mock),
-            patch(
-                "runner.validator.candidate._run_candidate_pipeline",
-                return_value=_make_failing_pipeline(),
-            ),
-        ):
-            run_candidate_validation(
-                repo_dir=tmp_path,
-                config=_make_config(),
-                patch=_make_patch(),
-                baseline=_make_baseline(),
-            )
+    def test_revert_called_even_on_test_failure(
+        self, repo_dir, candidate_mocks, base_config, base_patch,
+    ):
+        candidate_mocks["_run_candidate_pipeline"].return_value = _make_failing_pipeline()
+
+        run_candidate_validation(
+            repo_dir=repo_dir,
+            config=base_config,
+            patch=base_patch,
+            baseline=_make_baseline(),
+        )
 
         # 2 attempts (flaky rerun) → 2 reverts
-        assert revert_mock.call_count == 2
-
-    def test_revert_called_even_on_pipeline_exception(self, tmp_path):
-        revert_mock = MagicMock()
-
-        with (
-            patch("runner.validator.candidate.apply_diff"),
-            patch("runner.validator.candidate.revert_diff", revert_mock),
-            patch(
-                "runner.validator.candidate._run_candidate_pipeline",
-                side_effect=RuntimeError("unexpected"),
-            ),
-        ):
-            result = run_candidate_validation(
-                repo_dir=tmp_path,
-                config=_make_config(),
-                patch=_make_patch(),
-                baseline=_make_baseline(),
-            )
-
-        assert revert_mock.call_count >= 1
+        assert candidate_mocks["revert_diff"].call_count == 2
+
+    def test_revert_called_even_on_pipeline_exception(
+        self, repo_dir, candidate_mocks, base_config, base_patch,
+    ):
+        candidate_mocks["_run_candidate_pipeline"].side_effect = RuntimeError("unexpected")
+
+        result = run_candidate_validation(
+            repo_dir=repo_dir,
+            config=base_config,
+            patch=base_patch,
+            baseline=_make_baseline(),
+        )
+
+        assert candidate_mocks["revert_diff"].call_count >= 1
         assert result.is_accepted is False
 
 
 class TestSourceSafetyWiring:
     """Verify touched_files flows from PatchResult into evaluate_acceptance."""
 
-    def test_js_ts_patch_without_compile_step_rejects_end_to_end(self, tmp_path):
+    def test_js_ts_patch_without_compile_step_rejects_end_to_end(
+        self, repo_dir, candidate_mocks, base_config, base_patch,
+    ):
         """A .tsx edit with only a test step must be rejected by the pipeline."""
         pipeline_without_build = BaselineResult()
         pipeline_without_build.steps = [
@@ -283,32 +239,22 @@ class TestSourceSafetyWiring:
         ]
         pipeline_without_build.is_success = True
 
-        with (
-            patch("runner.validator.candidate.apply_diff"),
-            patch("runner.validator.candidate.revert_diff"),
-            patch(
-                "runner.validator.candidate._run_candidate_pipeline",
-                return_value=pipeline_without_build,
-            ),
-        ):
-            result = run_candidate_validation(
-                repo_dir=tmp_path,
-                config=_make_config(),
-                patch=PatchResult(
-                    diff="--- a/f\n+++ b/f\n@@ -1 +1 @@\n-old\n+new\n",
-                    explanation="",
-                    touched_files=["src/Component.tsx"],
-                    template_name="t",
-                    lines_changed=2,
-                ),
-                baseline=_make_baseline(),
-            )
+        candidate_mocks["_run_candidate_pipeline"].return_value = pipeline_without_build
+
+        result = run_candidate_validation(
+            repo_dir=repo_dir,
+            config=base_config,
+            patch=replace(base_patch, touched_files=["src/Component.tsx"]),
+            baseline=_make_baseline(),
+        )
 
         assert result.is_accepted is False
         assert result.final_verdict is not None
         assert "source_safety_gate" in result.final_verdict.gates_failed
 
-    def test_python_patch_without_compile_step_accepts(self, tmp_path):
+    def test_python_patch_without_compile_step_accepts(
+        self, repo_dir, candidate_mocks, base_config, base_patch,
+    ):
         """Python files don't need a JS/TS compile step."""
         pipeline_without_build = BaselineResult()
         pipeline_without_build.steps = [
@@ -316,70 +262,43 @@ class TestSourceSafetyWiring:
         ]
         pipeline_without_build.is_success = True
 
-        with (
-            patch("runner.validator.candidate.apply_diff"),
-            patch("runner.validator.candidate.revert_diff"),
-            patch(
-                "runner.validator.candidate._run_candidate_pipeline",
-                return_value=pipeline_without_build,
-            ),
-        ):
-            result = run_candidate_validation(
-                repo_dir=tmp_path,
-                config=_make_config(),
-                patch=PatchResult(
-                    diff="--- a/f\n+++ b/f\n@@ -1 +1 @@\n-old\n+new\n",
-                    explanation="",
-                    touched_files=["src/app.py"],
-                    template_name="t",
-                    lines_changed=2,
-                ),
-                baseline=_make_baseline(),
-            )
+        candidate_mocks["_run_candidate_pipeline"].return_value = pipeline_without_build
+
+        result = run_candidate_validation(
+            repo_dir=repo_dir,
+            config=base_config,
+            patch=replace(base_patch, touched_files=["src/app.py"]),
+            baseline=_make_baseline(),
+        )
 
         assert result.is_accepted is True
 
 
 class TestAttemptRecordSerialization:
-    def test_attempt_to_dict_contains_all_fields(self, tmp_path):
-        with (
-            patch("runner.validator.candidate.apply_diff"),
-            patch("runner.validator.candidate.revert_diff"),
-            patch(
-                "runner.validator.candidate._run_candidate_pipeline",
-                return_value=_make_passing_pipeline(),
-            ),
-        ):
-            result = run_candidate_validation(
-                repo_dir=tmp_path,
-                config=_make_config(),
-                patch=_make_patch(),
-                baseline=_make_baseline(),
-            )
+    def test_attempt_to_dict_contains_all_fields(
+        self, repo_dir, candidate_mocks, base_config, base_patch,
+    ):
+        candidate_mocks["_run_candidate_pipeline"].return_value = _make_passing_pipeline()
+
+        result = run_candidate_validation(
+            repo_dir=repo_dir,
+            config=base_config,
+            patch=base_patch,
+            baseline=_make_baseline(),
+        )
 
         d = result.attempts[0].to_dict()
-        assert all(k in d for k in [
-            "attempt_number", "patch_applied",
-            "pipeline_result", "verdict", "error", "timestamp",
-        ])
-
-    def test_candidate_result_to_dict(self, tmp_path):
-        with (
-            patch("runner.validator.candidate.apply_diff"),
-            patch("runner.validator.candidate.revert_diff"),
-            patch(
-                "runner.validator.candidate._run_candidate_pipeline",
-                return_value=_make_passing_pipeline(),
-            ),
-        ):
-            result = run_candidate_validation(
-                repo_dir=tmp_path,
-                config=_make_config(),
-                patch=_make_patch(),
-                baseline=_make_baseline(),
-            )
+        assert _ATTEMPT_RECORD_KEYS.issubset(d)
+
+    def test_candidate_result_to_dict(self, repo_dir, candidate_mocks, base_config, base_patch):
+        candidate_mocks["_run_candidate_pipeline"].return_value = _make_passing_pipeline()
+
+        result = run_candidate_validation(
+            repo_dir=repo_dir,
+            config=base_config,
+            patch=base_patch,
+            baseline=_make_baseline(),
+        )
 
         d = result.to_dict()
-        assert "attempts" in d
-        assert "final_verdict" in d
-        assert "is_accepted" in d
+        assert _CANDIDATE_RESULT_KEYS.issubset(d)
@@ -5,6 +5,8 @@ No actual commands are executed.
 """
 
 import os
+import subprocess
+from dataclasses import replace
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -13,19 +15,58 @@ import pytest
 from runner.sandbox.limits import apply_resource_limits
 
 from runner.detector.types import DetectionResult
+from runner.validator import executor
 from runner.validator.executor import _install_step_env, _make_preexec_fn, _prepare_test_step, run_baseline, run_step
-from runner.validator.types import PipelineError
+from runner.validator.types import PipelineError, StepResult
+
+
+# Step outcomes fed to the mocked run_step in TestRunBaseline. The strategy
+# engine only reads them, so one instance of each is shared across tests.
+_INSTALL_OK = StepResult(name="install", command="npm ci", exit_code=0, duration_seconds=5.0)
+_INSTALL_FAIL = StepResult(
+    name="install", command="npm ci", exit_code=1, duration_seconds=2.0,
+    stderr="npm ERR! ERESOLVE",
+)
+_BUILD_OK = StepResult(name="build", command="npm run build", exit_code=0, duration_seconds=10.0)
+_BUILD_FAIL = StepResult(name="build", command="npm run build", exit_code=1, duration_seconds=10.0)
+_TYPECHECK_OK = StepResult(
+    name="typecheck", command="npm run typecheck", exit_code=0, duration_seconds=3.0,
+)
+_TYPECHECK_FAIL = StepResult(
+    name="typecheck", command="npm run typecheck", exit_code=2, duration_seconds=3.0,
+)
+_TEST_OK = StepResult(name="test", command="npm test", exit_code=0, duration_seconds=8.0)
+_TEST_FAIL = StepResult(
+    name="test", command="npm test", exit_code=1, duration_seconds=8.0,
+    stderr="FAIL src/app.test.ts",
+)
+_BENCH_OK = StepResult(
+    name="bench", command="npm run bench", exit_code=0, duration_seconds=15.0,
+    stdout="Benchmark results",
+)
+_BENCH_FAIL = StepResult(name="bench", command="npm run bench", exit_code=1, duration_seconds=5.0)
+
+
+@pytest.fixture(scope="module")
+def npm_build_config(base_config) -> DetectionResult:
+    """The shared npm config plus a build step, the TestRunBaseline default."""
+    return replace(base_config, build_cmd="npm run build")
+
+
+@pytest.fixture
+def mock_step(monkeypatch) -> MagicMock:
+    """Stub run_step so run_baseline() tests control each step's outcome."""
+    mock = MagicMock()
+    monkeypatch.setattr(executor, "run_step", mock)
+    return mock
 
 
 class TestRunStep:
-    @patch("runner.validator.executor.subprocess.run")
-    def test_successful_step(self, mock_run, tmp_path):
-        mock_run.return_value = MagicMock(
-            returncode=0,
-            stdout="All tests passed",
-            stderr="",
+    def test_successful_step(self, mock_run, repo_dir):
+        mock_run.return_value = subprocess.CompletedProcess(
+            args=(), returncode=0, stdout="All tests passed", stderr="",
         )
-        result = run_step("test", "npm test", tmp_path)
+        result = run_step("test", "npm test", repo_dir)
 
         assert result.is_success is True
         assert result.name == "test"
@@ -33,143 +74,91 @@ class TestRunStep:
         assert result.exit_code == 0
         assert result.duration_seconds >= 0
 
-    @patch("runner.validator.executor.subprocess.run")
-    def test_failed_step(self, mock_run, tmp_path):
-        mock_run.return_value = MagicMock(
-            returncode=1,
-            stdout="",
-            stderr="Error: test failed",
+    def test_failed_step(self, mock_run, repo_dir):
+        mock_run.return_value = subprocess.CompletedProcess(
+            args=(), returncode=1, stdout="", stderr="Error: test failed",
         )
-        result = run_step("test", "npm test", tmp_path)
+        result = run_step("test", "npm test", repo_dir)
 
         assert result.is_success is False
         assert result.exit_code == 1
         assert "test failed" in result.stderr
 
-    @patch("runner.validator.executor.subprocess.run")
-    def test_timeout_returns_negative_exit(self, mock_run, tmp_path):
-        import subprocess
+    def test_timeout_returns_negative_exit(self, mock_run, repo_dir):
         mock_run.side_effect = subprocess.TimeoutExpired(cmd="npm test", timeout=300)
 
-        result = run_step("test", "npm test", tmp_path, timeout=300)
+        result = run_step("test", "npm test", repo_dir, timeout=300)
 
         assert result.exit_code == -1
         assert "Timed out" in result.stderr
 
-    @patch("runner.validator.executor.subprocess.run")
-    def test_unexpected_exception(self, mock_run, tmp_path):
+    def test_unexpected_exception(self, mock_run, repo_dir):
         mock_run.side_effect = OSError("No such file or directory")
 
-        result = run_step("install", "npm ci", tmp_path)
+        result = run_step("install", "npm ci", repo_dir)
 
         assert result.exit_code == -2
         assert "No such file" in result.stderr
 
-    @patch("runner.validator.executor.subprocess.run")
-    def test_uses_shell_mode(self, mock_run, tmp_path):
-        mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
+    def test_layers_step_env_over_inherited_environ(self, mock_run, repo_dir, monkeypatch):
+        monkeypatch.setenv("EVOBASE_TEST_INHERITED", "1")
+        run_step("test", "npm test", repo_dir, env={"CI": "true"})
 
-        run_step("build", "npm run build", tmp_path)
+        env = mock_run.call_args[1]["env"]
+        assert env["EVOBASE_TEST_INHERITED"] == "1"
+        assert env["CI"] == "true"
+
+    def test_uses_shell_mode(self, mock_run, repo_dir):
+        run_step("build", "npm run build", repo_dir)
 
         mock_run.assert_called_once()
         call_kwargs = mock_run.call_args[1]
         assert call_kwargs["shell"] is True
 
-    @patch("runner.validator.executor.subprocess.run")
-    def test_passes_cwd(self, mock_run, tmp_path):
-        mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
-
-        run_step("build", "npm run build", tmp_path)
+    def test_passes_cwd(self, mock_run, repo_dir):
+        run_step("build", "npm run build", repo_dir)
 
         call_kwargs = mock_run.call_args[1]
-        assert call_kwargs["cwd"] == str(tmp_path)
+        assert call_kwargs["cwd"] == str(repo_dir)
 
-    @patch("runner.validator.executor.subprocess.run")
-    def test_custom_timeout(self, mock_run, tmp_path):
-        mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
-
-        run_step("build", "npm run build", tmp_path, timeout=60)
+    def test_custom_timeout(self, mock_run, repo_dir):
+        run_step("build", "npm run build", repo_dir, timeout=60)
 
         call_kwargs = mock_run.call_args[1]
         assert call_kwargs["timeout"] == 60
 
-    @patch("runner.validator.executor.subprocess.run")
-    def test_sets_js_resource_profile_for_js_commands(self, mock_run, tmp_path):
-        mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
-
-        run_step("build", "npm run build", tmp_path)
-
-        call_kwargs = mock_run.call_args[1]
-        assert call_kwargs["env"]["EVOBASE_RESOURCE_PROFILE"] == "js"
-
-    @patch("runner.validator.executor.subprocess.run")
-    def test_sets_default_resource_profile_for_non_js_commands(self, mock_run, tmp_path):
-        mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
-
-        run_step("build", "make -j4", tmp_path)
+    @pytest.mark.parametrize("command, expected_profile", [
+        pytest.param("npm run build", "js", id="js-for-js-commands"),
+        pytest.param("make -j4", "native", id="native-for-make-commands"),
+        pytest.param("uv sync", "python", id="python-for-uv-commands"),
+        pytest.param("pytest -q", "python", id="python-for-pytest-commands"),
+        pytest.param("pip install -r requirements.txt", "python", id="python-for-pip-commands"),
+        pytest.param("./gradlew build", "jvm", id="jvm-for-gradle-commands"),
+        pytest.param("cargo build --release", "native", id="native-for-rust-commands"),
+        pytest.param("cmake --build build", "native", id="native-for-cpp-commands"),
+        pytest.param("g++ -O2 main.cpp", "native", id="native-for-gpp-commands"),
+        pytest.param(
+            "npx pytest-like-runner && make check", "js", id="js-wins-over-later-profiles",
+        ),
+        pytest.param("./run-tests.sh", "default", id="default-for-unknown-commands"),
+    ])
+    def test_sets_resource_profile(self, mock_run, repo_dir, command, expected_profile):
+        run_step("build", command, repo_dir)
 
         call_kwargs = mock_run.call_args[1]
-        assert call_kwargs["env"]["EVOBASE_RESOURCE_PROFILE"] == "native"
-
-    @patch("runner.validator.executor.subprocess.run")
-    def test_sets_python_resource_profile_for_uv_commands(self, mock_run, tmp_path):
-        mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
-
-        run_step("install", "uv sync", tmp_path)
-
-        call_kwargs = mock_run.call_args[1]
-        assert call_kwargs["env"]["EVOBASE_RESOURCE_PROFILE"] == "python"
-
-    @patch("runner.validator.executor.subprocess.run")
-    def test_sets_python_resource_profile_for_pytest_commands(self, mock_run, tmp_path):
-        mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
-
-        run_step("test", "pytest -q", tmp_path)
-
-        call_kwargs = mock_run.call_args[1]
-        assert call_kwargs["env"]["EVOBASE_RESOURCE_PROFILE"] == "python"
-
-    @patch("runner.validator.executor.subprocess.run")
-    def test_sets_python_resource_profile_for_pip_commands(self, mock_run, tmp_path):
-        mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
-
-        run_step("install", "pip install -r requirements.txt", tmp_path)
-
-        call_kwargs = mock_run.call_args[1]
-        assert call_kwargs["env"]["EVOBASE_RESOURCE_PROFILE"] == "python"
-
-    @patch("runner.validator.executor.subprocess.run")
-    def test_sets_jvm_resource_profile_for_gradle_commands(self, mock_run, tmp_path):
-        mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
-
-        run_step("build", "./gradlew build", tmp_path)
-
-        call_kwargs = mock_run.call_args[1]
-        assert call_kwargs["env"]["EVOBASE_RESOURCE_PROFILE"] == "jvm"
-
-    @patch("runner.validator.executor.subprocess.run")
-    def test_sets_native_resource_profile_for_rust_commands(self, mock_run, tmp_path):
-        mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
-
-        run_step("build", "cargo build --release", tmp_path)
-
-        call_kwargs = mock_run.call_args[1]
-        assert call_kwargs["env"]["EVOBASE_RESOURCE_PROFILE"] == "native"
-
-    @patch("runner.validator.executor.subprocess.run")
-    def test_sets_native_resource_profile_for_cpp_commands(self, mock_run, tmp_path):
-        mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
-
-        run_step("build", "cmake --build build", tmp_path)
-
-        call_kwargs = mock_run.call_args[1]
-        assert call_kwargs["env"]["EVOBASE_RESOURCE_PROFILE"] == "native"
+        assert call_kwargs["env"]["EVOBASE_RESOURCE_PROFILE"] == expected_profile
 
 
 class TestMakePreexecFn:
     """Verify that _make_preexec_fn propagates resource-limit env keys to os.environ."""
 
-    @patch("runner.validator.executor.apply_resource_limits")
+    @pytest.fixture(autouse=True)
+    def _isolated_environ(self, monkeypatch):
+        # preexec() writes straight into os.environ; keep those writes from
+        # leaking into whichever test the worker runs next.
+        monkeypatch.setattr(os, "environ", dict(os.environ))
+
+    @patch.object(executor, "apply_resource_limits")
     def test_syncs_resource_profile_into_os_environ(self, mock_apply):
         """preexec_fn must set EVOBASE_RESOURCE_PROFILE in os.environ so
         apply_resource_limits (which reads os.environ) sees the correct profile."""
@@ -186,7 +175,7 @@ class TestMakePreexecFn:
         assert os.environ.get("EVOBASE_RLIMIT_AS_BYTES_JS") == "0"
         mock_apply.assert_called_once()
 
-    @patch("runner.validator.executor.apply_resource_limits")
+    @patch.object(executor, "apply_resource_limits")
     def test_does_not_propagate_non_rlimit_keys(self, mock_apply):
         subprocess_env = {
             "EVOBASE_RESOURCE_PROFILE": "native",
@@ -201,12 +190,9 @@ class TestMakePreexecFn:
         assert os.environ.get("PATH") == old_path
         assert os.environ.get("EVOBASE_RESOURCE_PROFILE") == "native"
 
-    @patch("runner.validator.executor.subprocess.run")
-    def test_run_step_passes_preexec_with_env(self, mock_run, tmp_path):
+    def test_run_step_passes_preexec_with_env(self, mock_run, repo_dir):
         """run_step must pass a preexec_fn that carries the subprocess env, not the bare function."""
-        mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
-
-        run_step("test", "npm test", tmp_path)
+        run_step("test", "npm test", repo_dir)
 
         call_kwargs = mock_run.call_args[1]
         preexec = call_kwargs["preexec_fn"]
@@ -215,12 +201,12 @@ class TestMakePreexecFn:
 
 
 class TestInstallStepEnv:
-    @pytest.mark.parametrize("pm", ["npm", "pnpm", "yarn", "bun", "NPM"])
-    def test_js_package_managers_force_dev_dependencies(self, pm):
-        env = _install_step_env(pm)
-        assert env is not None
-        assert env["NODE_ENV"] == "development"
-        assert env["NPM_CONFIG_PRODUCTION"] == "false"
+    def test_js_package_managers_force_dev_dependencies(self):
+        for pm in ("npm", "pnpm", "yarn", "bun", "NPM"):
+            env = _install_step_env(pm)
+            assert env is not None, pm
+            assert env["NODE_ENV"] == "development", pm
+            assert env["NPM_CONFIG_PRODUCTION"] == "false", pm
 
     def test_bundler_env_includes_test_dev_groups(self):
         env = _install_step_env("bundler")
@@ -229,9 +215,16 @@ class TestInstallStepEnv:
         assert env["BUNDLE_FROZEN"] == "false"
         assert env["BUNDLE_WITHOUT"] == ""
 
-    @pytest.mark.parametrize("pm", [None, "", "pip", "poetry", "cargo"])
-    def test_non_js_package_managers_have_no_env_override(self, pm):
-        assert _install_step_env(pm) is None
+    def test_non_js_package_managers_have_no_env_override(self):
+        for pm in (None, "", "pip", "poetry", "cargo"):
+            assert _install_step_env(pm) is None, pm
+
+    def test_overrides_are_shared_and_read_only(self):
+        env = _install_step_env("npm")
+        assert _install_step_env("pnpm") is env
+        assert "PATH" not in env
+        with pytest.raises(TypeError):
+            env["NODE_ENV"] = "production"
 
 
 class TestPrepareTestStep:
@@ -254,9 +247,9 @@ class TestPrepareTestStep:
         assert env is not None
         assert env["CI"] == "true"
 
-    def test_direct_vitest_command_is_throttled(self, tmp_path):
+    def test_direct_vitest_command_is_throttled(self, repo_dir):
         command, env = _prepare_test_step(
-            repo_dir=tmp_path,
+            repo_dir=repo_dir,
             package_manager="pnpm",
             test_command="vitest run",
         )
@@ -282,9 +275,9 @@ class TestPrepareTestStep:
         assert env is not None
         assert env["CI"] == "true"
 
-    def test_non_js_test_has_no_overrides(self, tmp_path):
+    def test_non_js_test_has_no_overrides(self, repo_dir):
         command, env = _prepare_test_step(
-            repo_dir=tmp_path,
+            repo_dir=repo_dir,
             package_manager="pip",
             test_command="pytest -q",
         )
@@ -296,80 +289,108 @@ class TestPrepareTestStep:
 class TestRunBaseline:
     """Test the full baseline pipeline with mocked subprocess."""
 
-    def _make_config(self, **overrides) -> DetectionResult:
-        defaults = {
-            "package_manager": "npm",
-            "install_cmd": "npm ci",
-            "build_cmd": "npm run build",
-            "test_cmd": "npm test",
-            "typecheck_cmd": None,
-        }
-        defaults.update(overrides)
-        return DetectionResult(**defaults)
-
-    @patch("runner.validator.executor.run_step")
-    def test_happy_path_install_build_test(self, mock_step, tmp_path):
-        """Full pipeline: install -> build -> test, all pass."""
-        mock_step.side_effect = [
-            MagicMock(is_success=True, name="install", duration_seconds=5.0),
-            MagicMock(is_success=True, name="build", duration_seconds=10.0),
-            MagicMock(is_success=True, name="test", duration_seconds=8.0),
-        ]
-        config = self._make_config()
-
-        result = run_baseline(tmp_path, config)
-
-        assert result.is_success is True
-        assert len(result.steps) == 3
-        assert result.error is None
-
-    @patch("runner.validator.executor.run_step")
-    def test_install_step_uses_dev_env_for_npm(self, mock_step, tmp_path):
+    @pytest.mark.parametrize(
+        "outcomes, overrides, expected_success, expected_steps, expected_error",
+        [
+            pytest.param(
+                [_INSTALL_OK, _BUILD_OK, _TEST_OK], {},
+                True, ["install", "build", "test"], None,
+                id="happy-path-install-build-test",
+            ),
+            pytest.param(
+                [_INSTALL_FAIL], {},
+                False, ["install"], "install",
+                id="install-failure-aborts-pipeline",
+            ),
+            pytest.param(
+                [_INSTALL_OK, _BUILD_OK, _TEST_FAIL], {},
+                False, ["install", "build", "test"], "test",
+                id="test-failure-aborts-pipeline",
+            ),
+            pytest.param(
+                [_INSTALL_OK, _BUILD_FAIL, _TEST_OK], {},
+                True, ["install", "build", "test"], None,
+                id="build-failure-is-noncritical",
+            ),
+            pytest.param(
+                [_INSTALL_OK, _BUILD_OK, _TYPECHECK_OK, _TEST_OK],
+                {"typecheck_cmd": "npm run typecheck"},
+                True, ["install", "build", "typecheck", "test"], None,
+                id="typecheck-included-when-configured",
+            ),
+            pytest.param(
+                [_INSTALL_OK, _BUILD_OK, _TYPECHECK_FAIL, _TEST_OK],
+                {"typecheck_cmd": "npm run typecheck"},
+                True, ["install", "build", "typecheck", "test"], None,
+                id="typecheck-failure-is-noncritical",
+            ),
+            pytest.param(
+                [_INSTALL_OK, _TEST_OK], {"build_cmd": None},
+                True, ["install", "test"], None,
+                id="no-build-cmd-skips-build",
+            ),
+            pytest.param(
+                [_INSTALL_OK, _BUILD_OK], {"test_cmd": None},
+                True, ["install", "build"], None,
+                id="no-test-cmd-skips-test",
+            ),
+        ],
+    )
+    def test_pipeline_outcome(
+        self, mock_step, repo_dir, npm_build_config,
+        outcomes, overrides, expected_success, expected_steps, expected_error,
+    ):
+        """Install and test are critical; build and typecheck failures are not."""
+        mock_step.side_effect = outcomes
+
+        result = run_baseline(repo_dir, replace(npm_build_config, **overrides))
+
+        assert result.is_success is expected_success
+        assert [s.name for s in result.steps] == expected_steps
+        if expected_error is None:
+            assert result.error is None
+        else:
+            assert expected_error in result.error.lower()
+
+    def test_install_step_uses_dev_env_for_npm(self, mock_step, repo_dir, npm_build_config):
         """Install step forces devDependencies for JS package managers."""
-        mock_step.side_effect = [
-            MagicMock(is_success=True, name="install", duration_seconds=5.0),
-            MagicMock(is_success=True, name="build", duration_seconds=10.0),
-            MagicMock(is_success=True, name="test", duration_seconds=8.0),
-        ]
-        config = self._make_config(package_manager="npm")
+        mock_step.side_effect = [_INSTALL_OK, _BUILD_OK, _TEST_OK]
+        config = replace(npm_build_config, package_manager="npm")
 
-        run_baseline(tmp_path, config)
+        run_baseline(repo_dir, config)
 
         install_call = mock_step.call_args_list[0]
         assert install_call.args[0] == "install"
         assert install_call.kwargs["env"]["NODE_ENV"] == "development"
         assert install_call.kwargs["env"]["NPM_CONFIG_PRODUCTION"] == "false"
 
-    @patch("runner.validator.executor.run_step")
-    def test_install_step_has_no_env_override_for_non_js_pm(self, mock_step, tmp_path):
-        mock_step.side_effect = [
-            MagicMock(is_success=True, name="install", duration_seconds=5.0),
-            MagicMock(is_success=True, name="build", duration_seconds=10.0),
-            MagicMock(is_success=True, name="test", duration_seconds=8.0),
-        ]
-        config = self._make_config(package_manager="pip", install_cmd="pip install -r requirements.txt")
+    def test_install_step_has_no_env_override_for_non_js_pm(
+        self, mock_step, repo_dir, npm_build_config,
+    ):
+        mock_step.side_effect = [_INSTALL_OK, _BUILD_OK, _TEST_OK]
+        config = replace(
+            npm_build_config,
+            package_manager="pip",
+            install_cmd="pip install -r requirements.txt",
+        )
 
-        run_baseline(tmp_path, config)
+        run_baseline(repo_dir, config)
 
         install_call = mock_step.call_args_list[0]
         assert install_call.args[0] == "install"
         assert install_call.kwargs["env"] is None
 
-    @patch("runner.validator.executor.run_step")
-    def test_install_step_uses_bundler_env(self, mock_step, tmp_path):
-        mock_step.side_effect = [
-            MagicMock(is_success=True, name="install", duration_seconds=5.0),
-            MagicMock(is_success=True, name="build", duration_seconds=10.0),
-            MagicMock(is_success=True, name="test", duration_seconds=8.0),
-        ]
-        config = self._make_config(
+    def test_install_step_uses_bundler_env(self, mock_step, repo_dir, npm_build_config):
+        mock_step.side_effect = [_INSTALL_OK, _BUILD_OK, _TEST_OK]
+        config = replace(
+            npm_build_config,
             package_manager="bundler",
             install_cmd="bundle install",
             build_cmd="bundle exec rake build",
             test_cmd="bundle exec rspec",
         )
 
-        run_baseline(tmp_path, config)
+        run_baseline(repo_dir, config)
 
         install_call = mock_step.call_args_list[0]
         assert install_call.args[0] == "install"
@@ -377,153 +398,21 @@ class TestRunBaseline:
         assert install_call.kwargs["env"]["BUNDLE_FROZEN"] == "false"
         assert install_call.kwargs["env"]["BUNDLE_WITHOUT"] == ""
 
-    @patch("runner.validator.executor.run_step")
-    def test_install_failure_aborts_pipeline(self, mock_step, tmp_path):
-        """Install is critical; failure stops the entire pipeline."""
-        mock_step.return_value = MagicMock(
-            is_success=False, exit_code=1, name="install", duration_seconds=2.0,
-            command="npm ci",
-        )
-        # Make it a proper StepResult-like object for PipelineError
-        from runner.validator.types import StepResult
-        mock_step.return_value = StepResult(
-            name="install", command="npm ci", exit_code=1, duration_seconds=2.0,
-            stderr="npm ERR! ERESOLVE",
-        )
-        config = self._make_config()
-
-        result = run_baseline(tmp_path, config)
-
-        assert result.is_success is False
-        assert "install" in result.error.lower()
-        assert len(result.steps) == 1  # Only install ran
-
-    @patch("runner.validator.executor.run_step")
-    def test_test_failure_aborts_pipeline(self, mock_step, tmp_path):
-        """Test is critical; failure stops after test step."""
-        from runner.validator.types import StepResult
-        mock_step.side_effect = [
-            StepResult(name="install", command="npm ci", exit_code=0, duration_seconds=5.0),
-            StepResult(name="build", command="npm run build", exit_code=0, duration_seconds=10.0),
-            StepResult(name="test", command="npm test", exit_code=1, duration_seconds=8.0,
-                       stderr="FAIL src/app.test.ts"),
-        ]
-        config = self._make_config()
-
-        result = run_baseline(tmp_path, config)
-
-        assert result.is_success is False
-        assert "test" in result.error.lower()
-        assert len(result.steps) == 3
-
-    @patch("runner.validator.executor.run_step")
-    def test_build_failure_is_noncritical(self, mock_step, tmp_path):
-        """Build failure doesn't stop the pipeline."""
-        from runner.validator.types import StepResult
-        mock_step.side_effect = [
-            StepResult(name="install", command="npm ci", exit_code=0, duration_seconds=5.0),
-            StepResult(name="build", command="npm run build", exit_code=1, duration_seconds=10.0),
-            StepResult(name="test", command="npm test", exit_code=0, duration_seconds=8.0),
-        ]
-        config = self._make_config()
-
-        result = run_baseline(tmp_path, config)
-
-        assert result.is_success is True
-        assert len(result.steps) == 3
-
-    @patch("runner.validator.executor.run_step")
-    def test_typecheck_included_when_configured(self, mock_step, tmp_path):
-        from runner.validator.types import StepResult
-        mock_step.side_effect = [
-            StepResult(name="install", command="npm ci", exit_code=0, duration_seconds=5.0),
-            StepResult(name="build", command="npm run build", exit_code=0, duration_seconds=10.0),
-            StepResult(name="typecheck", command="npm run typecheck", exit_code=0, duration_seconds=3.0),
-            StepResult(name="test", command="npm test", exit_code=0, duration_seconds=8.0),
-        ]
-        config = self._make_config(typecheck_cmd="npm run typecheck")
+    def test_bench_cmd_runs_when_provided(self, mock_step, repo_dir, npm_build_config):
+        mock_step.side_effect = [_INSTALL_OK, _TEST_OK, _BENCH_OK]
+        config = replace(npm_build_config, build_cmd=None)
 
-        result = run_baseline(tmp_path, config)
-
-        assert result.is_success is True
-        assert len(result.steps) == 4
-        step_names = [s.name for s in result.steps]
-        assert "typecheck" in step_names
-
-    @patch("runner.validator.executor.run_step")
-    def test_typecheck_failure_is_noncritical(self, mock_step, tmp_path):
-        from runner.validator.types import StepResult
-        mock_step.side_effect = [
-            StepResult(name="install", command="npm ci", exit_code=0, duration_seconds=5.0),
-            StepResult(name="build", command="npm run build", exit_code=0, duration_seconds=10.0),
-            StepResult(name="typecheck", command="npm run typecheck", exit_code=2, duration_seconds=3.0),
-            StepResult(name="test", command="npm test", exit_code=0, duration_seconds=8.0),
-        ]
-        config = self._make_config(typecheck_cmd="npm run typecheck")
-
-        result = run_baseline(tmp_path, config)
-
-        assert result.is_success is True
-
-    @patch("runner.validator.executor.run_step")
-    def test_no_build_cmd_skips_build(self, mock_step, tmp_path):
-        from runner.validator.types import StepResult
-        mock_step.side_effect = [
-            StepResult(name="install", command="npm ci", exit_code=0, duration_seconds=5.0),
-            StepResult(name="test", command="npm test", exit_code=0, duration_seconds=8.0),
-        ]
-        config = self._make_config(build_cmd=None)
-
-        result = run_baseline(tmp_path, config)
-
-        assert result.is_success is True
-        assert len(result.steps) == 2
-        step_names = [s.name for s in result.steps]
-        assert "build" not in step_names
-
-    @patch("runner.validator.executor.run_step")
-    def test_bench_cmd_runs_when_provided(self, mock_step, tmp_path):
-        from runner.validator.types import StepResult
-        mock_step.side_effect = [
-            StepResult(name="install", command="npm ci", exit_code=0, duration_seconds=5.0),
-            StepResult(name="test", command="npm test", exit_code=0, duration_seconds=8.0),
-            StepResult(name="bench", command="npm run bench", exit_code=0,
-                       duration_seconds=15.0, stdout="Benchmark results"),
-        ]
-        config = self._make_config(build_cmd=None)
-
-        result = run_baseline(tmp_path, config, bench_cmd="npm run bench")
+        result = run_baseline(repo_dir, config, bench_cmd="npm run bench")
 
         assert result.is_success is True
         assert result.bench_result is not None
         assert result.bench_result["command"] == "npm run bench"
 
-    @patch("runner.validator.executor.run_step")
-    def test_bench_failure_is_noncritical(self, mock_step, tmp_path):
-        from runner.validator.types import StepResult
-        mock_step.side_effect = [
-            StepResult(name="install", command="npm ci", exit_code=0, duration_seconds=5.0),
-            StepResult(name="test", command="npm test", exit_code=0, duration_seconds=8.0),
-            StepResult(name="bench", command="npm run bench", exit_code=1, duration_seconds=5.0),
-        ]
-        config = self._make_config(build_cmd=None)
+    def test_bench_failure_is_noncritical(self, mock_step, repo_dir, npm_build_config):
+        mock_step.side_effect = [_INSTALL_OK, _TEST_OK, _BENCH_FAIL]
+        config = replace(npm_build_config, build_cmd=None)
 
-        result = run_baseline(tmp_path, config, bench_cmd="npm run bench")
+        result = run_baseline(repo_dir, config, bench_cmd="npm run bench")
 
         assert result.is_success is True
         assert result.bench_result is None
-
-    @patch("runner.validator.executor.run_step")
-    def test_no_test_cmd_skips_test(self, mock_step, tmp_path):
-        from runner.validator.types import StepResult
-        mock_step.side_effect = [
-            StepResult(name="install", command="npm ci", exit_code=0, duration_seconds=5.0),
-            StepResult(name="build", command="npm run build", exit_code=0, duration_seconds=10.0),
-        ]
-        config = self._make_config(test_cmd=None)
-
-        result = run_baseline(tmp_path, config)
-
-        assert result.is_success is True
-        step_names = [s.name for s in result.steps]
-        assert "test" not in step_names
@@ -3,7 +3,7 @@
 import difflib
 import subprocess
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 import pytest
 
@@ -59,16 +59,14 @@ class TestApplyDiff:
             with pytest.raises(PatchApplyError, match="patch binary not found"):
                 apply_diff(tmp_path, diff)
 
-    def test_raises_on_nonzero_exit_code(self, tmp_path):
+    def test_raises_on_nonzero_exit_code(self, tmp_path, mock_run):
         diff = _make_diff("old\n", "new\n")
-        mock_result = MagicMock()
-        mock_result.returncode = 1
-        mock_result.stdout = ""
-        mock_result.stderr = "hunk FAILED"
+        mock_run.return_value = subprocess.CompletedProcess(
+            args=(), returncode=1, stdout="", stderr="hunk FAILED",
+        )
 
-        with patch("runner.validator.patch_applicator.subprocess.run", return_value=mock_result):
-            with pytest.raises(PatchApplyError, match="patch failed"):
-                apply_diff(tmp_path, diff)
+        with pytest.raises(PatchApplyError, match="patch failed"):
+            apply_diff(tmp_path, diff)
 
 
 class TestRevertDiff:
@@ -92,6 +90,10 @@ class TestRevertDiff:
         with pytest.raises(PatchApplyError, match="Empty diff"):
             revert_diff(tmp_path, "")
 
+    def test_raises_on_whitespace_only_diff(self, tmp_path):
+        with pytest.raises(PatchApplyError, match="Empty diff"):
+            revert_diff(tmp_path, "\t\r\n \f\v")
+
     def test_raises_when_patch_binary_missing(self, tmp_path):
         diff = _make_diff("old\n", "new\n")
         with patch("runner.validator.patch_applicator.subprocess.run") as mock_run:
@@ -99,69 +101,60 @@ class TestRevertDiff:
             with pytest.raises(PatchApplyError, match="patch binary not found"):
                 revert_diff(tmp_path, diff)
 
-    def test_raises_on_nonzero_exit_code(self, tmp_path):
+    def test_raises_on_nonzero_exit_code(self, tmp_path, mock_run):
         diff = _make_diff("old\n", "new\n")
-        mock_result = MagicMock()
-        mock_result.returncode = 1
-        mock_result.stdout = ""
-        mock_result.stderr = "hunk FAILED"
+        mock_run.return_value = subprocess.CompletedProcess(
+            args=(), returncode=1, stdout="", stderr="hunk FAILED",
+        )
 
-        with patch("runner.validator.patch_applicator.subprocess.run", return_value=mock_result):
-            with pytest.raises(PatchApplyError, match="patch revert failed"):
-                revert_diff(tmp_path, diff)
+        with pytest.raises(PatchApplyError, match="patch revert failed"):
+            revert_diff(tmp_path, diff)
 
 
 class TestFuzzFactor:
     """Verify the fuzz flag is included so LLM-generated diffs with slightly
     off context lines are still accepted by patch."""
 
-    def test_apply_includes_fuzz_flag(self, tmp_path):
-        diff = _make_diff("old\n", "new\n")
-        captured: list[list[str]] = []
-
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-
-        with patch(
-            "runner.validator.patch_applicator.subprocess.run",
-            side_effect=lambda cmd, **_: captured.append(cmd) or mock_result,
-        ):
-            apply_diff(tmp_path, diff)
+    def test_apply_includes_fuzz_flag(self, tmp_path, mock_run):
+        apply_diff(tmp_path, _make_diff("old\n", "new\n"))
 
-        assert captured, "subprocess.run was not called"
-        assert "--fuzz=3" in captured[0], f"--fuzz=3 missing from cmd: {captured[0]}"
+        mock_run.assert_called_once()
+        cmd = mock_run.call_args[0][0]
+        assert "--fuzz=3" in cmd, f"--fuzz=3 missing from cmd: {cmd}"
 
-    def test_revert_includes_fuzz_flag(self, tmp_path):
-        diff = _make_diff("old\n", "new\n")
-        captured: list[list[str]] = []
+    def test_revert_includes_fuzz_flag(self, tmp_path, mock_run):
+        revert_diff(tmp_path, _make_diff("old\n", "new\n"))
 
-        mock_result = MagicMock()
-        mock_result.returncode = 0
+        mock_run.assert_called_once()
+        cmd = mock_run.call_args[0][0]
+        assert "--fuzz=3" in cmd, f"--fuzz=3 missing from cmd: {cmd}"
 
-        with patch(
-            "runner.validator.patch_applicator.subprocess.run",
-            side_effect=lambda cmd, **_: captured.append(cmd) or mock_result,
-        ):
-            revert_diff(tmp_path, diff)
 
-        assert captured, "subprocess.run was not called"
-        assert "--fuzz=3" in captured[0], f"--fuzz=3 missing from cmd: {captured[0]}"
+_WHICH = "runner.validator.patch_applicator.shutil.which"
 
 
 class TestCheckPatchAvailable:
+    @pytest.fixture(autouse=True)
+    def _clear_cache(self):
+        check_patch_available.cache_clear()
+        yield
+        check_patch_available.cache_clear()
+
     def test_returns_true_when_available(self):
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        with patch("runner.validator.patch_applicator.subprocess.run", return_value=mock_result):
+        with patch(_WHICH, return_value="/usr/bin/patch"):
             assert check_patch_available() is True
 
     def test_returns_false_when_not_found(self):
-        with patch("runner.validator.patch_applicator.subprocess.run") as mock_run:
-            mock_run.side_effect = FileNotFoundError()
+        with patch(_WHICH, return_value=None):
             assert check_patch_available() is False
 
-    def test_returns_false_on_nonzero_exit(self):
-        mock_result = MagicMock()
-        mock_result.returncode = 1
-        with patch("runner.validator.patch_applicator.subprocess.run", return_value=mock_result):
-            assert check_patch_available() is False
+    def test_result_is_cached_without_spawning(self):
+        with (
+            patch(_WHICH, return_value="/usr/bin/patch") as mock_which,
+            patch("runner.validator.patch_applicator.subprocess.run") as mock_run,
+        ):
+            assert check_patch_available() is True
+            assert check_patch_available() is True
+
+        mock_which.assert_called_once_with("patch")
+        mock_run.assert_not_called()
@@ -1,22 +1,33 @@
 """Unit tests for baseline pipeline types."""
 
+from types import MappingProxyType
+
 import pytest
 
 from runner.validator.types import BaselineResult, PipelineError, StepResult
 
 
-class TestStepResult:
-    def test_success_when_exit_zero(self):
-        step = StepResult(name="test", command="npm test", exit_code=0, duration_seconds=1.5)
-        assert step.is_success is True
+# Expected to_dict() payload of the build step; read-only so no test can mutate it.
+_EXPECTED_BUILD_STEP_DICT = MappingProxyType({
+    "name": "build",
+    "command": "npm run build",
+    "exit_code": 0,
+    "duration_seconds": 12.345,
+    "stdout_lines": 2,
+    "stderr_lines": 0,
+    "is_success": True,
+})
 
-    def test_failure_when_nonzero_exit(self):
-        step = StepResult(name="test", command="npm test", exit_code=1, duration_seconds=1.5)
-        assert step.is_success is False
 
-    def test_failure_on_timeout(self):
-        step = StepResult(name="test", command="npm test", exit_code=-1, duration_seconds=300.0)
-        assert step.is_success is False
+class TestStepResult:
+    @pytest.mark.parametrize("exit_code, duration_seconds, expected", [
+        pytest.param(0, 1.5, True, id="success-when-exit-zero"),
+        pytest.param(1, 1.5, False, id="failure-when-nonzero-exit"),
+        pytest.param(-1, 300.0, False, id="failure-on-timeout"),
+    ])
+    def test_is_success(self, step_factory, exit_code, duration_seconds, expected):
+        step = step_factory(exit_code=exit_code, duration_seconds=duration_seconds)
+        assert step.is_success is expected
 
     def test_to_dict_includes_all_fields(self):
         step = StepResult(
@@ -28,20 +39,15 @@ class TestStepResult:
             stderr="",
         )
         d = step.to_dict()
-        assert d["name"] == "build"
-        assert d["command"] == "npm run build"
-        assert d["exit_code"] == 0
-        assert d["duration_seconds"] == 12.345
-        assert d["stdout_lines"] == 2
-        assert d["stderr_lines"] == 0
+        assert d == _EXPECTED_BUILD_STEP_DICT
+        # Equality treats 1 == True; the stored JSON must carry a real bool.
         assert d["is_success"] is True
 
-    def test_to_dict_empty_stdout(self):
-        step = StepResult(name="test", command="cmd", exit_code=0, duration_seconds=0.0)
-        assert step.to_dict()["stdout_lines"] == 0
+    def test_to_dict_empty_stdout(self, step_factory):
+        assert step_factory().to_dict()["stdout_lines"] == 0
 
-    def test_to_dict_rounds_duration(self):
-        step = StepResult(name="test", command="cmd", exit_code=0, duration_seconds=1.23456789)
+    def test_to_dict_rounds_duration(self, step_factory):
+        step = step_factory(duration_seconds=1.23456789)
         assert step.to_dict()["duration_seconds"] == 1.235
 
 
@@ -50,18 +56,18 @@ class TestBaselineResult:
         result = BaselineResult()
         assert result.is_success is False
 
-    def test_to_dict_includes_total_duration(self):
+    def test_to_dict_includes_total_duration(self, step_factory):
         result = BaselineResult(
             steps=[
-                StepResult(name="install", command="npm ci", exit_code=0, duration_seconds=5.0),
-                StepResult(name="test", command="npm test", exit_code=0, duration_seconds=10.0),
+                step_factory(name="install", command="npm ci", duration_seconds=5.0),
+                step_factory(duration_seconds=10.0),
             ],
             is_success=True,
         )
         d = result.to_dict()
-        assert d["total_duration_seconds"] == 15.0
+        assert d.items() >= {"total_duration_seconds": 15.0, "is_success": True}.items()
         assert d["is_success"] is True
-        assert len(d["steps"]) == 2
+        assert [s["name"] for s in d["steps"]] == ["install", "test"]
 
     def test_to_dict_with_error(self):
         result = BaselineResult(error="Install failed", is_success=False)
@@ -74,8 +80,7 @@ class TestBaselineResult:
             is_success=True,
             bench_result={"command": "npm run bench", "stdout": "fast"},
         )
-        d = result.to_dict()
-        assert d["bench_result"]["command"] == "npm run bench"
+        assert result.to_dict()["bench_result"] == {"command": "npm run bench", "stdout": "fast"}
 
     def test_to_dict_empty_steps(self):
         result = BaselineResult()
@@ -85,15 +90,12 @@ class TestBaselineResult:
 
 
 class TestPipelineError:
-    def test_carries_step_result(self):
-        step = StepResult(name="install", command="npm ci", exit_code=1, duration_seconds=2.0)
-        err = PipelineError(step)
+    @pytest.mark.parametrize("args, expected", [
+        pytest.param((), "Step 'install' failed with exit code 1", id="default"),
+        pytest.param(("Tests are broken",), "Tests are broken", id="custom"),
+    ])
+    def test_message_and_step_result(self, step_factory, args, expected):
+        step = step_factory(name="install", command="npm ci", exit_code=1)
+        err = PipelineError(step, *args)
+        assert str(err) == expected
         assert err.step_result is step
-        assert "install" in str(err)
-        assert "exit code 1" in str(err)
-
-    def test_custom_message(self):
-        step = StepResult(name="test", command="npm test", exit_code=2, duration_seconds=1.0)
-        err = PipelineError(step, "Tests are broken")
-        assert str(err) == "Tests are broken"
-        assert err.step_result.exit_code == 2